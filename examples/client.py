@@ -3,190 +3,275 @@
 import asyncio
 import aiohttp
 import json
+import time
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
+
+# Constant WebSocket payloads are serialized once instead of on every send
+SUBSCRIBE_BTC_USD = dumps(
+    {
+        "type": "SUBSCRIBE",
+        "channel": "TICKER",
+        "symbol": "BTC/USD",
+        "request_id": "SUB1",
+    }
+)
+PLACE_ORDER_BTC_USD = dumps(
+    {
+        "type": "PLACE_ORDER",
+        "request_id": "ORDER1",
+        "symbol": "BTC/USD",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "price": "48500",
+        "quantity": "0.25",
+    }
+)
+
+# REST limit-buy body with only price and quantity varying per order
+BUY_LIMIT_BTC_USD_TMPL = (
+    b'{"symbol":"BTC/USD","side":"BUY","type":"LIMIT","price":"%b","quantity":"%b"}'
+)
+
+
+class TTLCache:
+    """In-memory cache for idempotent GETs with stale-while-revalidate.
+
+    Fresh entries are returned directly. Entries older than ``ttl`` but within
+    ``ttl + swr`` are returned immediately while a background task refreshes
+    them; anything older is fetched before returning.
+    """
 
-
-async def rest_api_examples(session_id: str):
+    def __init__(self, ttl: float, swr: float = 0.0):
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry is considered fresh
+            swr: Extra seconds a stale entry may still be served
+        """
+        self.ttl = ttl
+        self.swr = swr
+        self.data = {}
+        self._refreshing = {}
+
+    async def fetch(self, session: aiohttp.ClientSession, url: str, headers=None):
+        """Return the JSON body for url, hitting the network only when needed.
+
+        Args:
+            session: HTTP session used for misses and refreshes
+            url: Request URL, also used as the cache key
+            headers: Optional request headers
+
+        Returns:
+            Decoded JSON body
+        """
+        entry = self.data.get(url)
+        if entry is not None:
+            value, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                return value
+            if age < self.ttl + self.swr:
+                if url not in self._refreshing:
+                    task = asyncio.create_task(self._refresh(session, url, headers))
+                    self._refreshing[url] = task
+                    task.add_done_callback(lambda _: self._refreshing.pop(url, None))
+                return value
+        return await self._refresh(session, url, headers)
+
+    async def _refresh(self, session: aiohttp.ClientSession, url: str, headers=None):
+        async with session.get(url, headers=headers) as resp:
+            resp.raise_for_status()
+            value = await resp.json(loads=loads)
+        self.data[url] = (value, time.monotonic())
+        return value
+
+
+# Symbols change rarely; the ticker moves every tick. Health is never cached.
+static_cache = TTLCache(ttl=5.0, swr=30.0)
+ticker_cache = TTLCache(ttl=0.5, swr=1.0)
+
+
+async def rest_api_examples(session_id: str, session: aiohttp.ClientSession):
     """Demonstrate REST API usage.
 
     Args:
         session_id: Session identifier for requests
+        session: Shared HTTP session
     """
     base_url = "http://localhost:8765"
     headers = {"X-Session-ID": session_id}
 
-    async with aiohttp.ClientSession() as session:
-        print("\n" + "=" * 60)
-        print("REST API EXAMPLES")
-        print("=" * 60)
+    print("\n" + "=" * 60)
+    print("REST API EXAMPLES")
+    print("=" * 60)
 
-        # Health check
-        print("\n1. Health Check")
-        async with session.get(f"{base_url}/health") as resp:
-            data = await resp.json()
-            print(f"   Status: {resp.status}")
-            print(f"   Response: {data}")
-
-        # Get symbols
-        print("\n2. Get Available Symbols")
-        async with session.get(f"{base_url}/api/v1/symbols") as resp:
-            data = await resp.json()
-            print(f"   Symbols: {data['symbols']}")
-
-        # Get ticker
-        print("\n3. Get Ticker Data")
-        async with session.get(f"{base_url}/api/v1/ticker?symbol=BTC/USD") as resp:
-            data = await resp.json()
-            print(f"   Symbol: {data['symbol']}")
-            print(f"   Last Price: ${data['last_price']}")
-            print(f"   Bid: ${data['bid']}")
-            print(f"   Ask: ${data['ask']}")
-
-        # Get balance
-        print("\n4. Get Account Balance")
-        async with session.get(f"{base_url}/api/v1/balance", headers=headers) as resp:
-            data = await resp.json()
-            print(f"   Balances: {data['balances']}")
-
-        # Place a limit buy order
-        print("\n5. Place Limit Buy Order")
-        order_data = {
-            "symbol": "BTC/USD",
-            "side": "BUY",
-            "type": "LIMIT",
-            "price": "49000",
-            "quantity": "0.5",
-        }
-        async with session.post(
-            f"{base_url}/api/v1/orders", json=order_data, headers=headers
-        ) as resp:
-            data = await resp.json()
-            if resp.status != 201:
-                print(f"\n❌ ERROR: {data.get('error', 'Unknown error')}")
-                print(f"   Status Code: {resp.status}")
-                print(f"   Full Response: {data}")
-                return
-            print(f"   Order ID: {data['order_id']}")
-            print(f"   Status: {data['status']}")
-            print(f"   Price: ${data['price']}")
-            print(f"   Quantity: {data['quantity']}")
-            order_id = data["order_id"]
-
-        # Get all orders
-        print("\n6. Get All Orders")
-        async with session.get(f"{base_url}/api/v1/orders", headers=headers) as resp:
-            data = await resp.json()
-            print(f"   Total Orders: {len(data['orders'])}")
-            for order in data["orders"]:
-                print(
-                    f"   - {order['order_id'][:8]}... {order['side']} "
-                    f"{order['quantity']} @ ${order['price']} ({order['status']})"
-                )
-
-        # Get specific order
-        print(f"\n7. Get Order {order_id[:8]}...")
-        async with session.get(
-            f"{base_url}/api/v1/orders/{order_id}", headers=headers
-        ) as resp:
-            data = await resp.json()
-            print(f"   Symbol: {data['symbol']}")
-            print(f"   Side: {data['side']}")
-            print(f"   Status: {data['status']}")
+    async def get_json(url: str, **kwargs):
+        """GET url, raising on HTTP errors like TTLCache does; returns (status, body)."""
+        async with session.get(url, **kwargs) as resp:
+            resp.raise_for_status()
+            return resp.status, loads(await resp.read())
+
+    # The read-only queries do not depend on each other, so issue them concurrently
+    (health_status, health), symbols, ticker, (_, balance), (_, position) = (
+        await asyncio.gather(
+            get_json(f"{base_url}/health"),
+            static_cache.fetch(session, f"{base_url}/api/v1/symbols"),
+            ticker_cache.fetch(session, f"{base_url}/api/v1/ticker?symbol=BTC/USD"),
+            get_json(f"{base_url}/api/v1/balance", headers=headers),
+            get_json(f"{base_url}/api/v1/position?symbol=BTC/USD", headers=headers),
+        )
+    )
 
-        # Cancel order
-        print(f"\n8. Cancel Order {order_id[:8]}...")
-        async with session.delete(
-            f"{base_url}/api/v1/orders/{order_id}", headers=headers
-        ) as resp:
-            data = await resp.json()
-            print(f"   Result: {data['status']}")
-
-        # Get position
-        print("\n9. Get Position")
-        async with session.get(
-            f"{base_url}/api/v1/position?symbol=BTC/USD", headers=headers
-        ) as resp:
-            data = await resp.json()
-            print(f"   Symbol: {data['symbol']}")
-            print(f"   Asset: {data['asset']}")
-            print(f"   Quantity: {data['quantity']}")
-
-
-async def websocket_examples(session_id: str):
+    # Health check
+    print("\n1. Health Check")
+    print(f"   Status: {health_status}")
+    print(f"   Response: {health}")
+
+    # Get symbols
+    print("\n2. Get Available Symbols")
+    print(f"   Symbols: {symbols['symbols']}")
+
+    # Get ticker
+    print("\n3. Get Ticker Data")
+    print(f"   Symbol: {ticker['symbol']}")
+    print(f"   Last Price: ${ticker['last_price']}")
+    print(f"   Bid: ${ticker['bid']}")
+    print(f"   Ask: ${ticker['ask']}")
+
+    # Get balance
+    print("\n4. Get Account Balance")
+    print(f"   Balances: {balance['balances']}")
+
+    # Place a limit buy order
+    print("\n5. Place Limit Buy Order")
+    order_data = {
+        "symbol": "BTC/USD",
+        "side": "BUY",
+        "type": "LIMIT",
+        "price": "49000",
+        "quantity": "0.5",
+    }
+    async with session.post(
+        f"{base_url}/api/v1/orders", json=order_data, headers=headers
+    ) as resp:
+        data = loads(await resp.read())
+        if resp.status != 201:
+            print(f"\n❌ ERROR: {data.get('error', 'Unknown error')}")
+            print(f"   Status Code: {resp.status}")
+            print(f"   Full Response: {data}")
+            return
+        print(f"   Order ID: {data['order_id']}")
+        print(f"   Status: {data['status']}")
+        print(f"   Price: ${data['price']}")
+        print(f"   Quantity: {data['quantity']}")
+        order_id = data["order_id"]
+
+    # Get all orders
+    print("\n6. Get All Orders")
+    async with session.get(f"{base_url}/api/v1/orders", headers=headers) as resp:
+        data = loads(await resp.read())
+        print(f"   Total Orders: {len(data['orders'])}")
+        for order in data["orders"]:
+            print(
+                f"   - {order['order_id'][:8]}... {order['side']} "
+                f"{order['quantity']} @ ${order['price']} ({order['status']})"
+            )
+
+    # Get specific order
+    print(f"\n7. Get Order {order_id[:8]}...")
+    async with session.get(
+        f"{base_url}/api/v1/orders/{order_id}", headers=headers
+    ) as resp:
+        data = loads(await resp.read())
+        print(f"   Symbol: {data['symbol']}")
+        print(f"   Side: {data['side']}")
+        print(f"   Status: {data['status']}")
+
+    # Cancel order
+    print(f"\n8. Cancel Order {order_id[:8]}...")
+    async with session.delete(
+        f"{base_url}/api/v1/orders/{order_id}", headers=headers
+    ) as resp:
+        data = loads(await resp.read())
+        print(f"   Result: {data['status']}")
+
+    # Get position
+    print("\n9. Get Position")
+    print(f"   Symbol: {position['symbol']}")
+    print(f"   Asset: {position['asset']}")
+    print(f"   Quantity: {position['quantity']}")
+
+
+async def websocket_examples(session_id: str, session: aiohttp.ClientSession):
     """Demonstrate WebSocket usage.
 
     Args:
         session_id: Session identifier for websocket
+        session: Shared HTTP session
     """
     ws_url = "ws://localhost:8765/ws"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.ws_connect(ws_url) as ws:
-            print("\n" + "=" * 60)
-            print("WEBSOCKET EXAMPLES")
-            print("=" * 60)
-
-            # Subscribe to market data
-            print("\n1. Subscribe to TICKER for BTC/USD")
-            subscribe_msg = {
-                "type": "SUBSCRIBE",
-                "channel": "TICKER",
-                "symbol": "BTC/USD",
-                "request_id": "SUB1",
-            }
-            await ws.send_str(json.dumps(subscribe_msg))
-            print("   Subscribed - listening for market data...")
-
-            # Receive a few market data messages
-            for i in range(3):
-                msg = await ws.receive()
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
-                    if data.get("type") == "MARKET_DATA":
-                        print(f"   Update {i+1}: Price ${data['last_price']}")
-
-            # Place order via WebSocket
-            print("\n2. Place Order via WebSocket")
-            order_msg = {
-                "type": "PLACE_ORDER",
-                "request_id": "ORDER1",
-                "symbol": "BTC/USD",
-                "side": "BUY",
-                "order_type": "LIMIT",
-                "price": "48500",
-                "quantity": "0.25",
+    async with session.ws_connect(ws_url) as ws:
+        print("\n" + "=" * 60)
+        print("WEBSOCKET EXAMPLES")
+        print("=" * 60)
+
+        # Subscribe to market data
+        print("\n1. Subscribe to TICKER for BTC/USD")
+        await ws.send_str(SUBSCRIBE_BTC_USD)
+        print("   Subscribed - listening for market data...")
+
+        # Receive a few market data messages
+        for i in range(3):
+            data = await ws.receive_json(loads=loads)
+            if data.get("type") == "MARKET_DATA":
+                print(f"   Update {i+1}: Price ${data['last_price']}")
+
+        # Place order via WebSocket
+        print("\n2. Place Order via WebSocket")
+        await ws.send_str(PLACE_ORDER_BTC_USD)
+
+        # Wait for response
+        data = await asyncio.wait_for(ws.receive_json(loads=loads), timeout=2.0)
+        if data.get("type") == "ORDER_ACK":
+            print(f"   Order Acknowledged: {data['order_id'][:8]}...")
+            print(f"   Status: {data['status']}")
+            ws_order_id = data["order_id"]
+
+            # Cancel via WebSocket
+            print("\n3. Cancel Order via WebSocket")
+            cancel_msg = {
+                "type": "CANCEL_ORDER",
+                "request_id": "CANCEL1",
+                "order_id": ws_order_id,
             }
-            await ws.send_str(json.dumps(order_msg))
-
-            # Wait for response
-            msg = await asyncio.wait_for(ws.receive(), timeout=2.0)
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                if data.get("type") == "ORDER_ACK":
-                    print(f"   Order Acknowledged: {data['order_id'][:8]}...")
-                    print(f"   Status: {data['status']}")
-                    ws_order_id = data["order_id"]
-
-                    # Cancel via WebSocket
-                    print("\n3. Cancel Order via WebSocket")
-                    cancel_msg = {
-                        "type": "CANCEL_ORDER",
-                        "request_id": "CANCEL1",
-                        "order_id": ws_order_id,
-                    }
-                    await ws.send_str(json.dumps(cancel_msg))
-
-                    # Wait for cancel confirmation
-                    msg = await asyncio.wait_for(ws.receive(), timeout=2.0)
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        data = json.loads(msg.data)
-                        if data.get("type") == "ORDER_CANCEL":
-                            print(f"   Order Cancelled: {data['order_id'][:8]}...")
-
-            print("\n   WebSocket examples complete")
-
-
-async def hybrid_usage_pattern():
-    """Demonstrate typical hybrid REST/WS pattern used by real bots."""
+            await ws.send_str(dumps(cancel_msg))
+
+            # Wait for cancel confirmation
+            data = await asyncio.wait_for(ws.receive_json(loads=loads), timeout=2.0)
+            if data.get("type") == "ORDER_CANCEL":
+                print(f"   Order Cancelled: {data['order_id'][:8]}...")
+
+        print("\n   WebSocket examples complete")
+
+
+async def hybrid_usage_pattern(http_session: aiohttp.ClientSession):
+    """Demonstrate typical hybrid REST/WS pattern used by real bots.
+
+    Args:
+        http_session: Shared HTTP session
+    """
     session_id = "hybrid-bot-session"
 
     print("\n" + "=" * 60)
@@ -200,72 +285,62 @@ async def hybrid_usage_pattern():
     base_url = "http://localhost:8765"
     ws_url = "ws://localhost:8765/ws"
     headers = {"X-Session-ID": session_id}
-
-    async with aiohttp.ClientSession() as http_session:
-        # Use REST to get initial state
-        print("\n1. Use REST to get initial state...")
-        async with http_session.get(
-            f"{base_url}/api/v1/balance", headers=headers
-        ) as resp:
-            balance = await resp.json()
-            print(f"   Initial Balance: {balance['balances']}")
-
-        async with http_session.get(f"{base_url}/api/v1/ticker?symbol=BTC/USD") as resp:
-            ticker = await resp.json()
-            print(f"   Current BTC/USD Price: ${ticker['last_price']}")
-
-        # Connect WebSocket for real-time updates
-        print("\n2. Connect WebSocket for real-time market data...")
-        async with http_session.ws_connect(ws_url) as ws:
-            subscribe_msg = {
-                "type": "SUBSCRIBE",
-                "channel": "TICKER",
-                "symbol": "BTC/USD",
-                "request_id": "SUB1",
-            }
-            await ws.send_str(json.dumps(subscribe_msg))
-            print("   Subscribed to TICKER feed")
-
-            # Monitor price and place order via REST when condition met
-            print("\n3. Monitor price and use REST for trading...")
-            for i in range(5):
-                msg = await ws.receive()
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
-                    if data.get("type") == "MARKET_DATA":
-                        price = float(data["last_price"])
-                        print(f"   Market Update: ${price:.2f}")
-
-                        # Example: Place order via REST if price crosses threshold
-                        if i == 2:  # Simulate condition being met
-                            print("\n4. Condition met - placing order via REST...")
-                            order_data = {
-                                "symbol": "BTC/USD",
-                                "side": "BUY",
-                                "type": "LIMIT",
-                                "price": str(int(price) - 100),
-                                "quantity": "0.1",
-                            }
-                            async with http_session.post(
-                                f"{base_url}/api/v1/orders",
-                                json=order_data,
-                                headers=headers,
-                            ) as resp:
-                                order = await resp.json()
-                                print(f"   Order placed: {order['order_id'][:8]}...")
-                                created_order_id = order["order_id"]
-
-                        # Continue monitoring WebSocket for fills/updates
-                        # while using REST for queries
-                        if i == 4:
-                            print("\n5. Use REST to check final order status...")
-                            async with http_session.get(
-                                f"{base_url}/api/v1/orders", headers=headers
-                            ) as resp:
-                                orders = await resp.json()
-                                print(f"   Total open orders: {len(orders['orders'])}")
-
-            print("\n   Hybrid pattern demonstration complete")
+    json_headers = {**headers, "Content-Type": "application/json"}
+
+    # Use REST to get initial state
+    print("\n1. Use REST to get initial state...")
+    async with http_session.get(
+        f"{base_url}/api/v1/balance", headers=headers
+    ) as resp:
+        balance = loads(await resp.read())
+        print(f"   Initial Balance: {balance['balances']}")
+
+    ticker = await ticker_cache.fetch(
+        http_session, f"{base_url}/api/v1/ticker?symbol=BTC/USD"
+    )
+    print(f"   Current BTC/USD Price: ${ticker['last_price']}")
+
+    # Connect WebSocket for real-time updates
+    print("\n2. Connect WebSocket for real-time market data...")
+    async with http_session.ws_connect(ws_url) as ws:
+        await ws.send_str(SUBSCRIBE_BTC_USD)
+        print("   Subscribed to TICKER feed")
+
+        # Monitor price and place order via REST when condition met
+        print("\n3. Monitor price and use REST for trading...")
+        for i in range(5):
+            data = await ws.receive_json(loads=loads)
+            if data.get("type") == "MARKET_DATA":
+                price = float(data["last_price"])
+                print(f"   Market Update: ${price:.2f}")
+
+                # Example: Place order via REST if price crosses threshold
+                if i == 2:  # Simulate condition being met
+                    print("\n4. Condition met - placing order via REST...")
+                    payload = BUY_LIMIT_BTC_USD_TMPL % (
+                        str(int(price) - 100).encode(),
+                        b"0.1",
+                    )
+                    async with http_session.post(
+                        f"{base_url}/api/v1/orders",
+                        data=payload,
+                        headers=json_headers,
+                    ) as resp:
+                        order = loads(await resp.read())
+                        print(f"   Order placed: {order['order_id'][:8]}...")
+                        created_order_id = order["order_id"]
+
+                # Continue monitoring WebSocket for fills/updates
+                # while using REST for queries
+                if i == 4:
+                    print("\n5. Use REST to check final order status...")
+                    async with http_session.get(
+                        f"{base_url}/api/v1/orders", headers=headers
+                    ) as resp:
+                        orders = loads(await resp.read())
+                        print(f"   Total open orders: {len(orders['orders'])}")
+
+        print("\n   Hybrid pattern demonstration complete")
 
 
 async def main():
@@ -279,13 +354,18 @@ async def main():
 
     await asyncio.sleep(1)
 
-    # Run examples
+    # Run examples over one pooled session so every phase reuses keep-alive connections
     try:
-        await rest_api_examples("rest-demo-session")
-        await asyncio.sleep(1)
-        await websocket_examples("ws-demo-session")
-        await asyncio.sleep(1)
-        await hybrid_usage_pattern()
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            # Keep idle connections around across the REST, WS and hybrid phases
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=60),
+        ) as session:
+            await rest_api_examples("rest-demo-session", session)
+            await asyncio.sleep(1)
+            await websocket_examples("ws-demo-session", session)
+            await asyncio.sleep(1)
+            await hybrid_usage_pattern(session)
 
         print("\n" + "=" * 60)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY")
@@ -304,4 +384,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
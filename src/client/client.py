@@ -2,39 +2,53 @@
 
 import asyncio
 import logging
-from threading import Thread
+import sys
+from decimal import Decimal
 from typing import Optional, Dict, List
 
 import aiohttp
 
 from .dashboard import TradingDashboard
-from .network.network_manager import NetworkManager
+from .network.network_manager import NetworkManager, create_http_session, subscribe_message
 from .config import ClientConfig
+from .network.codec import dumpb, loads
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
 )
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 60
+_BASIC_HEADER = f"\n{_BANNER}\nSCENARIO: Basic Trading\n{_BANNER}"
+_STREAM_HEADER = f"\n{_BANNER}\nSCENARIO: Market Data Streaming\n{_BANNER}"
+_RAPID_HEADER = f"\n{_BANNER}\nSCENARIO: Rapid Order Placement\n{_BANNER}"
+_DONE_HEADER = f"\n{_BANNER}\nAll scenarios completed\n{_BANNER}"
 
 
 class ExchangeClient:
     """Client for interacting with exchange simulator."""
 
+    _ORDER_TEMPLATE = {"symbol": None, "side": None, "type": None, "quantity": None}
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
     def __init__(
         self,
         base_url: str = "http://localhost:8765",
         session_id: str = "client",
         config: Optional[ClientConfig] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
     ):
         self.base_url = base_url
         self.session_id = session_id
         self.headers = {"X-Session-ID": session_id}
         self.config = config or ClientConfig()
         self.network_manager = NetworkManager(
-            base_url=base_url, session_id=session_id, config=self.config
+            base_url=base_url,
+            session_id=session_id,
+            config=self.config,
+            http_session=http_session,
         )
-        self._http_session: Optional[aiohttp.ClientSession] = None
-        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
 
     async def __aenter__(self):
         return self
@@ -48,13 +62,8 @@ class ExchangeClient:
 
     async def subscribe(self, channel: str, symbol: str) -> bool:
         """Subscribe to WebSocket channel."""
-        msg = {
-            "type": "SUBSCRIBE",
-            "channel": channel,
-            "symbol": symbol,
-            "request_id": f"{channel}_{symbol}",
-        }
-        return await self.network_manager.send_ws_message(msg)
+        msg, frame = subscribe_message(channel, symbol)
+        return await self.network_manager.send_ws_message(msg, frame)
 
     async def receive_ws_message(self, timeout: float = 1.0) -> Optional[Dict]:
         """Receive WebSocket message."""
@@ -63,20 +72,20 @@ class ExchangeClient:
     async def get_balance(self) -> Optional[Dict[str, str]]:
         """Get account balance via REST."""
         resp = await self.network_manager.rest_request(
-            "GET", "/api/v1/balance", headers=self.headers
+            "GET", "/api/v1/balance"
         )
         if resp and resp.status == 200:
-            data = await resp.json()
+            data = loads(await resp.read())
             return data.get("balances")
         return None
 
     async def get_ticker(self, symbol: str) -> Optional[Dict]:
         """Get ticker data via REST."""
         resp = await self.network_manager.rest_request(
-            "GET", f"/api/v1/ticker?symbol={symbol}"
+            "GET", "/api/v1/ticker", params={"symbol": symbol}
         )
         if resp and resp.status == 200:
-            return await resp.json()
+            return loads(await resp.read())
         return None
 
     async def place_order(
@@ -88,27 +97,26 @@ class ExchangeClient:
         price: Optional[str] = None,
     ) -> Optional[Dict]:
         """Place order via REST."""
-        order_data = {
-            "symbol": symbol,
-            "side": side,
-            "type": order_type,
-            "quantity": quantity,
-        }
+        order_data = self._ORDER_TEMPLATE.copy()
+        order_data["symbol"] = symbol
+        order_data["side"] = side
+        order_data["type"] = order_type
+        order_data["quantity"] = quantity
         if price:
             order_data["price"] = price
 
         resp = await self.network_manager.rest_request(
             "POST",
             "/api/v1/orders",
-            json=order_data,
-            headers=self.headers,
+            data=dumpb(order_data),
+            headers=self._JSON_HEADERS,
         )
         if resp:
             if resp.status == 201:
-                return await resp.json()
+                return loads(await resp.read())
             else:
                 try:
-                    data = await resp.json()
+                    data = loads(await resp.read())
                     print(f"Order placement failed: {data.get('error')}")
                 except:
                     pass
@@ -116,35 +124,38 @@ class ExchangeClient:
 
     async def get_orders(self, status: Optional[str] = None) -> List[Dict]:
         """Get orders via REST."""
-        endpoint = "/api/v1/orders"
-        if status:
-            endpoint += f"?status={status}"
+        params = {"status": status} if status else None
 
         resp = await self.network_manager.rest_request(
-            "GET", endpoint, headers=self.headers
+            "GET", "/api/v1/orders", params=params
         )
         if resp and resp.status == 200:
-            data = await resp.json()
+            data = loads(await resp.read())
             return data.get("orders", [])
         return []
 
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel order via REST."""
         resp = await self.network_manager.rest_request(
-            "DELETE", f"/api/v1/orders/{order_id}", headers=self.headers
+            "DELETE", f"/api/v1/orders/{order_id}"
         )
         return resp is not None and resp.status == 200
 
 
 async def run_scenarios(base_url: str = "http://localhost:8765"):
     """Run infrastructure testing scenarios."""
+    if sys.version_info >= (3, 12):
+        # Tasks whose first step completes synchronously skip a loop round-trip
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # One connection pool for every scenario instead of a new session per client
+    config = ClientConfig()
+    http_session = create_http_session(config)
 
     async def scenario_basic_trading():
-        print("\n" + "=" * 60)
-        print("SCENARIO: Basic Trading")
-        print("=" * 60)
+        print(_BASIC_HEADER)
 
-        async with ExchangeClient(base_url, "scenario_basic") as client:
+        async with ExchangeClient(base_url, "scenario_basic", config, http_session) as client:
             balance = await client.get_balance()
             print(f"Initial balance: {balance}")
 
@@ -167,51 +178,69 @@ async def run_scenarios(base_url: str = "http://localhost:8765"):
             print(f"Final balance: {final_balance}")
 
     async def scenario_market_data_stream():
-        print("\n" + "=" * 60)
-        print("SCENARIO: Market Data Streaming")
-        print("=" * 60)
+        print(_STREAM_HEADER)
 
-        async with ExchangeClient(base_url, "scenario_stream") as client:
+        async with ExchangeClient(base_url, "scenario_stream", config, http_session) as client:
             if await client.connect_ws():
                 print("WebSocket connected")
 
                 if await client.subscribe("TICKER", "BTC/USD"):
                     print("Subscribed to BTC/USD ticker")
 
+                    lines = []
                     for i in range(10):
                         msg = await client.receive_ws_message(timeout=2.0)
                         if msg and msg.get("type") == "MARKET_DATA":
-                            print(f"#{i+1}: ${msg['last_price']}")
+                            lines.append(f"#{i+1}: ${msg['last_price']}")
+                    if lines:
+                        sys.stdout.write("\n".join(lines) + "\n")
 
                 print("Stream complete")
 
     async def scenario_rapid_orders():
-        print("\n" + "=" * 60)
-        print("SCENARIO: Rapid Order Placement")
-        print("=" * 60)
+        print(_RAPID_HEADER)
 
-        async with ExchangeClient(base_url, "scenario_rapid") as client:
+        async with ExchangeClient(base_url, "scenario_rapid", config, http_session) as client:
             ticker = await client.get_ticker("BTC/USD")
             if ticker:
-                base_price = float(ticker['last_price'])
+                # Prices arrive as decimal strings; truncate once and stay in ints
+                base_price = int(Decimal(ticker['last_price']))
+
+                prices = [str(base_price - i * 100) for i in range(5)]
+                results = await asyncio.gather(
+                    *(client.place_order("BTC/USD", "BUY", "LIMIT", "0.1", price) for price in prices),
+                    return_exceptions=True,
+                )
 
                 orders_placed = []
-                for i in range(5):
-                    price = str(int(base_price - (i * 100)))
-                    order = await client.place_order("BTC/USD", "BUY", "LIMIT", "0.1", price)
-                    if order:
+                lines = []
+                for i, (price, order) in enumerate(zip(prices, results)):
+                    if isinstance(order, BaseException):
+                        logger.error("Order %d at $%s failed: %r", i + 1, price, order)
+                    elif order:
                         orders_placed.append(order['order_id'])
-                        print(f"Order {i+1}: ${price}")
+                        lines.append(f"Order {i+1}: ${price}")
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
 
                 print(f"\nPlaced {len(orders_placed)} orders")
 
                 all_orders = await client.get_orders()
                 print(f"Total orders: {len(all_orders)}")
 
-                for order_id in orders_placed:
-                    await client.cancel_order(order_id)
+                cancel_results = await asyncio.gather(
+                    *(client.cancel_order(order_id) for order_id in orders_placed),
+                    return_exceptions=True,
+                )
 
-                print("All orders cancelled")
+                cancelled = 0
+                for order_id, result in zip(orders_placed, cancel_results):
+                    if isinstance(result, BaseException):
+                        logger.error("Cancel of order %s failed: %r", order_id, result)
+                    elif result:
+                        cancelled += 1
+
+                print(f"Cancelled {cancelled}/{len(orders_placed)} orders")
 
     try:
         await scenario_basic_trading()
@@ -222,15 +251,15 @@ async def run_scenarios(base_url: str = "http://localhost:8765"):
 
         await scenario_rapid_orders()
 
-        print("\n" + "=" * 60)
-        print("All scenarios completed")
-        print("=" * 60)
+        print(_DONE_HEADER)
 
     except aiohttp.ClientConnectorError:
         print("\nERROR: Could not connect to server")
         print("Start server: python -m exchange_simulator.server")
     except Exception as e:
         print(f"\nERROR: {type(e).__name__}: {e}")
+    finally:
+        await http_session.close()
 
 
 def main():
@@ -243,20 +272,28 @@ def main():
     parser.add_argument("--symbol", default="BTC/USD", help="Trading symbol for dashboard")
     args = parser.parse_args()
 
+    # Both the scenario runner and the dashboard's network loop use asyncio.run
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     if args.scenarios:
-        print("=" * 60)
+        print(_BANNER)
         print("Exchange Simulator - Infrastructure Testing")
-        print("=" * 60)
+        print(_BANNER)
         print(f"\nServer: {args.base_url}")
         print("\nPress Ctrl+C to stop\n")
         asyncio.run(run_scenarios(args.base_url))
     else:
-        print("=" * 60)
+        print(_BANNER)
         print("Exchange Simulator - Trading Dashboard")
-        print("=" * 60)
+        print(_BANNER)
         print(f"Symbol: {args.symbol}")
         print(f"Server: {args.base_url}")
-        print("=" * 60)
+        print(_BANNER)
 
         dashboard = TradingDashboard(args.base_url, args.symbol)
         dashboard.run()
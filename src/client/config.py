@@ -1,11 +1,13 @@
 """Client configuration."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NetworkConfig(BaseModel):
     """Network management configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     heartbeat_interval: float = Field(
         default=60.0, description="PING interval in seconds"
     )
@@ -44,10 +46,32 @@ class NetworkConfig(BaseModel):
         default=10.0,
         description="Seconds without WS messages before declaring connection silent",
     )
+    http_pool_limit: int = Field(
+        default=100, description="Maximum simultaneous HTTP connections"
+    )
+    http_pool_limit_per_host: int = Field(
+        default=40, description="Maximum simultaneous HTTP connections per host"
+    )
+    http_keepalive_timeout: float = Field(
+        default=30.0, description="Seconds to keep idle HTTP connections open"
+    )
+    http_dns_cache_ttl: int = Field(
+        default=300, description="Seconds to cache resolved server addresses"
+    )
+    ws_compress: int = Field(
+        default=15,
+        description="permessage-deflate window bits to request for WebSocket (0 disables)",
+    )
+
+
+# Frozen, so every ClientConfig() can share one default instead of building its own
+_DEFAULT_NETWORK = NetworkConfig()
 
 
 class ClientConfig(BaseModel):
     """Client configuration."""
 
-    network: NetworkConfig = Field(default_factory=NetworkConfig)
+    model_config = ConfigDict(frozen=True)
+
+    network: NetworkConfig = Field(default_factory=lambda: _DEFAULT_NETWORK)
 
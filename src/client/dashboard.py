@@ -1,113 +1,360 @@
 """Trading dashboard for exchange simulator."""
 
 import asyncio
-import json
 import logging
+import time
 from collections import deque
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from threading import Thread, Lock
+from types import MappingProxyType
 from typing import Any, Optional
 
 import aiohttp
+import numpy as np
 import plotly.graph_objs as go
-from dash import Dash, dcc, html
-from dash.dependencies import Output, Input
+from dash import Dash, dcc, html, no_update
+from dash.dependencies import Output, Input, State
+
+from .network.codec import loads
+from .network.network_manager import parse_timestamp, subscribe_message
+
+logger = logging.getLogger(__name__)
+
+# Emit a debug summary of the WebSocket tick stream once per this many ticks
+LOG_EVERY = 1000
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_ns(timestamp: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch.
+
+    Naive datetimes are treated as UTC. Plain integer arithmetic is several
+    times cheaper per tick than building a ``np.datetime64``.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND * 1000
+
+
+_CANDLE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _local_offset() -> np.timedelta64:
+    """Current offset of the local timezone from UTC."""
+    return np.timedelta64(datetime.now().astimezone().utcoffset(), "ns")
+
+
+def _bucket_means(columns: list, max_points: int) -> list:
+    """Average each value column over ``max_points`` equal-count buckets.
+
+    Timestamps take the midpoint of each bucket's first and last tick. Means
+    are linear, so a spread computed from the averaged bids and asks equals
+    the bucket mean of the spread.
+
+    Args:
+        columns: Ordered timestamps followed by value columns
+        max_points: Number of buckets
+
+    Returns:
+        Columns in the same order with one row per bucket
+    """
+    timestamps, *values = columns
+    bounds = np.linspace(0, len(timestamps), max_points + 1).astype(np.intp)
+    starts = bounds[:-1]
+    counts = np.diff(bounds)
+    ts = timestamps.view(np.int64)
+    first, last = ts[starts], ts[bounds[1:] - 1]
+    midpoints = (first + (last - first) // 2).view("datetime64[ns]")
+    return [midpoints] + [np.add.reduceat(column, starts) / counts for column in values]
+
+
+# Outputs whose last-rendered inputs each browser tab keeps in a dcc.Store
+_RENDERED_OUTPUTS = (
+    "connection-status",
+    "market-info",
+    "price-chart",
+    "spread-chart",
+    "account-info",
+    "orders-info",
+)
+
+
+def _render_key(n: int, rendered: Optional[list], *inputs) -> Optional[list]:
+    """Return the render key for inputs, or None if the client already shows it.
+
+    Args:
+        n: Interval tick counter; a page load (n == 0) always renders
+        rendered: Key this client last rendered, from its dcc.Store
+        *inputs: JSON-serializable data versions and callback inputs
+
+    Returns:
+        The key to store alongside the new output, or None if unchanged
+    """
+    key = list(inputs)
+    if n and rendered == key:
+        return None
+    return key
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Select indices with a vectorized largest-triangle-three-buckets pass.
+
+    The first and last points are always kept. Interior points are split into
+    ``max_points - 2`` buckets and each bucket keeps the point forming the
+    largest triangle with the averages of its neighbouring buckets.
+
+    Args:
+        x: Monotonic x coordinates
+        y: Values to preserve the shape of
+        max_points: Number of indices to return
+
+    Returns:
+        Sorted index array of length ``max_points``
+    """
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.linspace(0, n - 1, max_points).astype(np.intp)
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+    sizes = ends - starts
+
+    xi, yi = x[1:-1], y[1:-1]
+    x_avg = np.add.reduceat(xi, starts - 1) / sizes
+    y_avg = np.add.reduceat(yi, starts - 1) / sizes
+    # Neighbouring anchors: previous/next bucket averages, or the fixed end points
+    xa = np.concatenate(([x[0]], x_avg[:-1]))
+    ya = np.concatenate(([y[0]], y_avg[:-1]))
+    xc = np.concatenate((x_avg[1:], [x[-1]]))
+    yc = np.concatenate((y_avg[1:], [y[-1]]))
+
+    # Twice the triangle area is |a*y + b*x + c| with per-bucket coefficients,
+    # so every point is scored in one pass over contiguous arrays
+    a = xa - xc
+    b = yc - ya
+    c = -a * ya - b * xa
+    area = np.abs(np.repeat(a, sizes) * yi + np.repeat(b, sizes) * xi + np.repeat(c, sizes))
+
+    # First point in each bucket that reaches the bucket's maximum area
+    best = np.fmax.reduceat(area, starts - 1)
+    hits = np.flatnonzero(area == np.repeat(best, sizes))
+    bucket = np.repeat(np.arange(len(sizes)), sizes)[hits]
+    first = np.concatenate(([True], bucket[1:] != bucket[:-1]))
+    picked = hits[first] + 1
+    return np.concatenate(([0], picked, [n - 1]))
 
 
 class MarketDataBuffer:
-    """Thread-safe buffer for market data."""
+    """Single-producer ring buffer for market data backed by NumPy arrays.
+
+    Writes come only from the network event loop thread and readers never
+    block them: every write bumps ``_seq`` to an odd value before touching the
+    arrays and back to even afterwards, and ``get`` retries its copy until it
+    sees the same even sequence on both sides (a seqlock). Writes keep only
+    plain floats and ints; ``get`` builds the ``last_update`` datetime.
+    """
 
     def __init__(self, maxlen=60000):
-        self.timestamps = deque(maxlen=maxlen)
-        self.prices = deque(maxlen=maxlen)
-        self.bids = deque(maxlen=maxlen)
-        self.asks = deque(maxlen=maxlen)
-        self.volumes = deque(maxlen=maxlen)
-        self.lock = Lock()
+        self.maxlen = maxlen
+        self._timestamps = np.empty(maxlen, dtype="datetime64[ns]")
+        # Integer view of the timestamps so writes skip datetime64 conversion
+        self._timestamps_ns = self._timestamps.view(np.int64)
+        self._prices = np.empty(maxlen, dtype=np.float64)
+        self._bids = np.empty(maxlen, dtype=np.float64)
+        self._asks = np.empty(maxlen, dtype=np.float64)
+        self._volumes = np.empty(maxlen, dtype=np.float64)
+        self._columns = (
+            self._timestamps, self._prices, self._bids, self._asks, self._volumes
+        )
+        self._head = 0
+        self._count = 0
+        self._seq = 0
         self.symbol = None
-        self.last_update = None
+        self._last_update = None
+
+    def add(self, timestamp, price, bid, ask, volume, symbol, timestamp_ns=None):
+        ts = timestamp_ns if timestamp_ns is not None else _to_epoch_ns(timestamp)
+        self._seq += 1
+        head = self._head
+        self._timestamps_ns[head] = ts
+        self._prices[head] = price
+        self._bids[head] = bid
+        self._asks[head] = ask
+        self._volumes[head] = volume
+        self._head = (head + 1) % self.maxlen
+        self._count = min(self._count + 1, self.maxlen)
+        self.symbol = symbol
+        self._last_update = time.time()
+        self._seq += 1
 
-    def add(self, timestamp, price, bid, ask, volume, symbol):
-        with self.lock:
-            self.timestamps.append(timestamp)
-            self.prices.append(price)
-            self.bids.append(bid)
-            self.asks.append(ask)
-            self.volumes.append(volume)
-            self.symbol = symbol
-            self.last_update = datetime.now()
-
-    def get(self, max_points=None):
-        with self.lock:
-            timestamps = list(self.timestamps)
-            prices = list(self.prices)
-            bids = list(self.bids)
-            asks = list(self.asks)
-            volumes = list(self.volumes)
-
-            if max_points and len(timestamps) > max_points:
-                stride = len(timestamps) // max_points
-                timestamps = timestamps[::stride]
-                prices = prices[::stride]
-                bids = bids[::stride]
-                asks = asks[::stride]
-                volumes = volumes[::stride]
+    def add_many(self, rows):
+        """Append a batch of ticks as a single write.
 
-            return {
-                "timestamps": timestamps,
-                "prices": prices,
-                "bids": bids,
-                "asks": asks,
-                "volumes": volumes,
-                "symbol": self.symbol,
-                "last_update": self.last_update,
-            }
+        Args:
+            rows: Sequence of (timestamp, price, bid, ask, volume, symbol) tuples
+        """
+        if not rows:
+            return
+        rows = rows[-self.maxlen:]
+        timestamps, prices, bids, asks, volumes, symbols = zip(*rows)
+        n = len(rows)
+        ts = np.fromiter((_to_epoch_ns(t) for t in timestamps), dtype=np.int64, count=n)
+        idx = (self._head + np.arange(n)) % self.maxlen
+        self._seq += 1
+        self._timestamps_ns[idx] = ts
+        self._prices[idx] = prices
+        self._bids[idx] = bids
+        self._asks[idx] = asks
+        self._volumes[idx] = volumes
+        self._head = (self._head + n) % self.maxlen
+        self._count = min(self._count + n, self.maxlen)
+        self.symbol = symbols[-1]
+        self._last_update = time.time()
+        self._seq += 1
+
+    @property
+    def version(self):
+        """Write counter that changes whenever the buffer contents change."""
+        return self._seq
+
+    def _ordered(self, arr, head, count):
+        """Return a chronologically ordered copy of the populated part of arr."""
+        if count < self.maxlen:
+            return arr[:count].copy()
+        return np.concatenate((arr[head:], arr[:head]))
+
+    def get(self, max_points=None, method="uniform"):
+        """Get a snapshot of the buffer in insertion order.
+
+        Args:
+            max_points: Maximum number of points to return
+            method: Downsampling method: "uniform" or "lttb" pick ticks,
+                "mean" averages equal-count buckets
+
+        Returns:
+            Dictionary of arrays plus symbol and last update time
+        """
+        while True:
+            seq = self._seq
+            if seq & 1:
+                # Writer is mid-update; yield the GIL so it can finish
+                time.sleep(0)
+                continue
+            head, count = self._head, self._count
+            if max_points and count > max_points and method != "mean":
+                # Pick the points first and copy only those out of the ring
+                if method == "lttb":
+                    ts = self._ordered(self._timestamps, head, count)
+                    x = (ts - ts[0]).astype(np.float64)
+                    idx = _lttb_indices(x, self._ordered(self._prices, head, count), max_points)
+                else:
+                    # Evenly spaced indices that always keep the first and latest tick
+                    idx = np.linspace(0, count - 1, max_points).astype(np.intp)
+                if count == self.maxlen:
+                    idx = (idx + head) % self.maxlen
+                columns = [arr[idx] for arr in self._columns]
+            else:
+                columns = [self._ordered(arr, head, count) for arr in self._columns]
+            symbol = self.symbol
+            last_update = self._last_update
+            if self._seq == seq:
+                break
+
+        if method == "mean" and max_points and count > max_points:
+            columns = _bucket_means(columns, max_points)
+        timestamps, prices, bids, asks, volumes = columns
+        return {
+            "timestamps": timestamps,
+            "prices": prices,
+            "bids": bids,
+            "asks": asks,
+            "volumes": volumes,
+            "symbol": symbol,
+            "last_update": (
+                datetime.fromtimestamp(last_update) if last_update is not None else None
+            ),
+        }
 
 
 class AccountState:
-    """Thread-safe account state."""
+    """Thread-safe account state.
+
+    Writers publish a new immutable ``(balances, orders, stamp, versions)``
+    snapshot under the lock; ``get`` reads the current one without locking or
+    copying and, like ``MarketDataBuffer``, builds the ``last_update`` datetime.
+    Each version only moves when its field's contents actually change.
+    """
 
     def __init__(self):
-        self.balances = {}
-        self.orders = []
         self.lock = Lock()
-        self.last_update = None
+        self._state = (MappingProxyType({}), (), None, 0, 0)
 
-    def update_balances(self, balances):
+    def update(self, balances=None, orders=None):
+        """Replace balances and/or orders with a single snapshot swap."""
         with self.lock:
-            self.balances = balances
-            self.last_update = datetime.now()
+            current_balances, current_orders, _, balances_version, orders_version = self._state
+            if balances is not None and balances != current_balances:
+                current_balances = MappingProxyType(dict(balances))
+                balances_version += 1
+            if orders is not None:
+                orders = tuple(orders)
+                if orders != current_orders:
+                    current_orders = orders
+                    orders_version += 1
+            self._state = (
+                current_balances,
+                current_orders,
+                time.time(),
+                balances_version,
+                orders_version,
+            )
+
+    def update_balances(self, balances):
+        self.update(balances=balances)
 
     def update_orders(self, orders):
-        with self.lock:
-            self.orders = orders
-            self.last_update = datetime.now()
+        self.update(orders=orders)
 
     def get(self):
-        with self.lock:
-            return {
-                "balances": dict(self.balances),
-                "orders": list(self.orders),
-                "last_update": self.last_update,
-            }
+        balances, orders, last_update, balances_version, orders_version = self._state
+        return {
+            "balances": balances,
+            "orders": orders,
+            "last_update": (
+                datetime.fromtimestamp(last_update) if last_update is not None else None
+            ),
+            "balances_version": balances_version,
+            "orders_version": orders_version,
+        }
 
 
 class ConnectionHealth:
-    """Track connection health."""
+    """Track connection health.
+
+    ``ws_message_received`` runs once per frame on the network thread, the only
+    writer of the WebSocket fields, so it stores a monotonic timestamp without
+    taking the lock; ``get`` reads it lock-free too and converts it to
+    wall-clock time on read.
+    """
 
     def __init__(self):
         self.ws_connected = False
         self.rest_healthy = False
-        self.last_ws_message = None
+        self._last_ws_monotonic = None
         self.last_rest_check = None
         self.ws_message_count = 0
         self.lock = Lock()
 
     def ws_message_received(self):
-        with self.lock:
-            self.ws_connected = True
-            self.last_ws_message = datetime.now()
-            self.ws_message_count += 1
+        self._last_ws_monotonic = time.monotonic()
+        self.ws_message_count += 1
+        self.ws_connected = True
 
     def ws_disconnected(self):
         with self.lock:
@@ -119,19 +366,26 @@ class ConnectionHealth:
             self.last_rest_check = datetime.now()
 
     def get(self):
+        # The WebSocket fields are single-writer, so only the REST pair needs the lock
+        last_ws_monotonic = self._last_ws_monotonic
+        ws_stale = False
+        last_ws_message = None
+        if last_ws_monotonic is not None:
+            age = time.monotonic() - last_ws_monotonic
+            ws_stale = age > 5
+            last_ws_message = datetime.now() - timedelta(seconds=age)
+
         with self.lock:
-            now = datetime.now()
-            ws_stale = False
-            if self.last_ws_message:
-                ws_stale = (now - self.last_ws_message).total_seconds() > 5
+            rest_healthy = self.rest_healthy
+            last_rest_check = self.last_rest_check
 
-            return {
-                "ws_connected": self.ws_connected and not ws_stale,
-                "rest_healthy": self.rest_healthy,
-                "last_ws_message": self.last_ws_message,
-                "last_rest_check": self.last_rest_check,
-                "ws_message_count": self.ws_message_count,
-            }
+        return {
+            "ws_connected": self.ws_connected and not ws_stale,
+            "rest_healthy": rest_healthy,
+            "last_ws_message": last_ws_message,
+            "last_rest_check": last_rest_check,
+            "ws_message_count": self.ws_message_count,
+        }
 
 
 class CandlestickAggregator:
@@ -155,9 +409,18 @@ class CandlestickAggregator:
         self.current_candle_low = None
         self.current_candle_close = None
         self.current_candle_volume = 0.0
+        # Ticks before this belong to the current candle; avoids rounding every tick
+        self._current_candle_end = None
         
-        # Completed candles
+        # Completed candles, plus the same candles column-wise for charting
         self.candles = deque(maxlen=max_candles)
+        self._candle_columns = {
+            "timestamps": np.empty(max_candles, dtype="datetime64[ns]"),
+            **{field: np.empty(max_candles, dtype=np.float64) for field in _CANDLE_FIELDS},
+        }
+        self._candle_timestamps_ns = self._candle_columns["timestamps"].view(np.int64)
+        self._candle_head = 0
+        self._candle_version = 0
 
     def _get_candle_start(self, timestamp: datetime) -> datetime:
         """Get the start timestamp for the candle containing this timestamp."""
@@ -183,63 +446,127 @@ class CandlestickAggregator:
             List of completed candle dictionaries (empty if none completed)
         """
         with self.lock:
-            candle_start = self._get_candle_start(timestamp)
-            completed_candles = []
-
-            # If we're starting a new candle
-            if self.current_candle_start is None or candle_start > self.current_candle_start:
-                # If we had a previous candle, finalize it
-                if self.current_candle_start is not None:
-                    completed_candles.append({
-                        "timestamp": self.current_candle_start,
-                        "open": self.current_candle_open,
-                        "high": self.current_candle_high,
-                        "low": self.current_candle_low,
-                        "close": self.current_candle_close,
-                        "volume": self.current_candle_volume,
-                    })
-                    self.candles.append(completed_candles[-1])
-
-                    # Log completed candle info and check for discontinuities
-                    candle = completed_candles[-1]
-                    spread = candle["high"] - candle["low"]
-                    body = abs(candle["close"] - candle["open"])
-
-                    # Check if there's a discontinuity with the new candle's open
-                    discontinuity = abs(price - candle["close"])
-                    if discontinuity > 1.0:  # More than $1 gap
-                        logging.getLogger(__name__).warning(
-                            "DISCONTINUITY: Previous candle close=%.2f, new candle open=%.2f (gap=%.2f) from %s",
-                            candle["close"], price, discontinuity, source
-                        )
+            return self._add_tick(timestamp, price, volume, source)
 
-                    if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
-                        logging.getLogger(__name__).debug(
-                            "Completed candle at %s: O=%.2f H=%.2f L=%.2f C=%.2f (spread=%.2f, body=%.2f, ticks=%.0f)",
-                            candle["timestamp"], candle["open"], candle["high"],
-                            candle["low"], candle["close"], spread, body, candle["volume"] / 0.01
-                        )
+    def add_ticks(self, ticks, source: str = "unknown") -> list:
+        """Add a batch of ticks under a single lock acquisition.
 
-                # Start new candle
-                self.current_candle_start = candle_start
-                self.current_candle_open = price
+        Args:
+            ticks: Iterable of (timestamp, price, volume) tuples in time order
+            source: Source of the ticks (for debugging)
+
+        Returns:
+            List of completed candle dictionaries (empty if none completed)
+        """
+        completed_candles = []
+        with self.lock:
+            for timestamp, price, volume in ticks:
+                completed_candles.extend(self._add_tick(timestamp, price, volume, source))
+        return completed_candles
+
+    def _add_tick(self, timestamp: datetime, price: float, volume: float, source: str) -> list:
+        """Apply one tick; the caller holds the lock."""
+        # Fast path: the tick falls inside the current candle
+        if self._current_candle_end is not None and timestamp < self._current_candle_end:
+            if price > self.current_candle_high:
                 self.current_candle_high = price
+            elif price < self.current_candle_low:
                 self.current_candle_low = price
-                self.current_candle_close = price
-                self.current_candle_volume = volume
+            self.current_candle_close = price
+            self.current_candle_volume += volume
+            return []
+
+        candle_start = self._get_candle_start(timestamp)
+        completed_candles = []
+
+        # If we're starting a new candle
+        if self.current_candle_start is None or candle_start > self.current_candle_start:
+            # If we had a previous candle, finalize it
+            if self.current_candle_start is not None:
+                completed_candles.append({
+                    "timestamp": self.current_candle_start,
+                    "open": self.current_candle_open,
+                    "high": self.current_candle_high,
+                    "low": self.current_candle_low,
+                    "close": self.current_candle_close,
+                    "volume": self.current_candle_volume,
+                })
+                self.candles.append(completed_candles[-1])
+                self._store_candle_columns(completed_candles[-1])
+
+                # Log completed candle info and check for discontinuities
+                candle = completed_candles[-1]
+                spread = candle["high"] - candle["low"]
+                body = abs(candle["close"] - candle["open"])
+
+                # Check if there's a discontinuity with the new candle's open
+                discontinuity = abs(price - candle["close"])
+                if discontinuity > 1.0:  # More than $1 gap
+                    logger.warning(
+                        "DISCONTINUITY: Previous candle close=%.2f, new candle open=%.2f (gap=%.2f) from %s",
+                        candle["close"], price, discontinuity, source
+                    )
 
-                logging.getLogger(__name__).debug(
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Completed candle at %s: O=%.2f H=%.2f L=%.2f C=%.2f (spread=%.2f, body=%.2f, ticks=%.0f)",
+                        candle["timestamp"], candle["open"], candle["high"],
+                        candle["low"], candle["close"], spread, body, candle["volume"] / 0.01
+                    )
+
+            # Start new candle
+            self.current_candle_start = candle_start
+            self._current_candle_end = candle_start + timedelta(seconds=self.interval_seconds)
+            self.current_candle_open = price
+            self.current_candle_high = price
+            self.current_candle_low = price
+            self.current_candle_close = price
+            self.current_candle_volume = volume
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
                     "Started new candle at %s from %s: price=%.2f",
                     candle_start, source, price
                 )
-            else:
-                # Update current candle
-                self.current_candle_high = max(self.current_candle_high, price)
-                self.current_candle_low = min(self.current_candle_low, price)
-                self.current_candle_close = price
-                self.current_candle_volume += volume
+        else:
+            # Update current candle
+            self.current_candle_high = max(self.current_candle_high, price)
+            self.current_candle_low = min(self.current_candle_low, price)
+            self.current_candle_close = price
+            self.current_candle_volume += volume
+
+        return completed_candles
+
+    def _store_candle_columns(self, candle: dict) -> None:
+        """Write a completed candle into the column ring; the caller holds the lock."""
+        head = self._candle_head
+        self._candle_timestamps_ns[head] = _to_epoch_ns(candle["timestamp"])
+        for field in _CANDLE_FIELDS:
+            self._candle_columns[field][head] = candle[field]
+        self._candle_head = (head + 1) % self.max_candles
+        self._candle_version += 1
+
+    @property
+    def candle_version(self):
+        """Counter that changes whenever the completed candles change."""
+        return self._candle_version
+
+    def get_candle_columns(self, max_candles: int = None) -> dict:
+        """Get recent candles as one array per field, oldest first.
 
-            return completed_candles
+        Args:
+            max_candles: Maximum number of candles to return
+
+        Returns:
+            Dictionary of "timestamps" (naive UTC datetime64[ns]), "open",
+            "high", "low", "close" and "volume" arrays
+        """
+        with self.lock:
+            count = len(self.candles)
+            if max_candles and count > max_candles:
+                count = max_candles
+            idx = (self._candle_head - count + np.arange(count)) % self.max_candles
+            return {name: column[idx] for name, column in self._candle_columns.items()}
 
     def get_candles(self, max_candles: int = None) -> list:
         """Get recent candles for display.
@@ -251,10 +578,10 @@ class CandlestickAggregator:
             List of candle dictionaries
         """
         with self.lock:
-            candles = list(self.candles)
-            if max_candles and len(candles) > max_candles:
-                return candles[-max_candles:]
-            return candles
+            if max_candles and len(self.candles) > max_candles:
+                # Walk only the newest max_candles entries instead of copying the deque
+                return list(islice(reversed(self.candles), max_candles))[::-1]
+            return list(self.candles)
 
     def set_interval(self, interval_seconds: int) -> None:
         """Change the interval and clear existing data.
@@ -265,12 +592,15 @@ class CandlestickAggregator:
         with self.lock:
             self.interval_seconds = interval_seconds
             self.candles.clear()
+            self._candle_head = 0
+            self._candle_version += 1
             self.current_candle_start = None
             self.current_candle_open = None
             self.current_candle_high = None
             self.current_candle_low = None
             self.current_candle_close = None
             self.current_candle_volume = 0.0
+            self._current_candle_end = None
 
 
 class TradingDashboard:
@@ -292,21 +622,40 @@ class TradingDashboard:
         self.candlestick_aggregator = CandlestickAggregator(interval_seconds=1)
         self.current_interval = 1
         self.running = False
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
         # Track the latest timestamp we've processed from ANY source (REST or WS)
         # to avoid processing duplicate data when WS sends backlog after reconnection
         self._latest_processed_timestamp: Optional[datetime] = None
 
+        # Running WS tick stats, summarized at debug level every LOG_EVERY ticks
+        self._ws_tick_count = 0
+        self._ws_price_min = float("inf")
+        self._ws_price_max = float("-inf")
+
+        # One market data snapshot is shared by all callbacks until the buffer changes
+        self._snapshot_lock = Lock()
+        # (max_points, method) -> (buffer version, snapshot)
+        self._snapshots: dict = {}
+        self._candle_snapshot_key: Optional[tuple] = None
+        self._candle_snapshot: Optional[dict] = None
+
         # Track REST polling state
         self._rest_polling_task: Optional[asyncio.Task] = None
         self._rest_polling_active = False
+        # Cleared if the server predates the combined account endpoint
+        self._batch_account_endpoint = True
+        # Last ETag per account endpoint, sent back as If-None-Match
+        self._etags: dict = {}
 
         # Initialize network manager
         from .network.network_manager import NetworkManager
-        from .config import ClientConfig
+        from .config import ClientConfig, NetworkConfig
 
-        self.config = config or ClientConfig()
+        # One host and a handful of requests in flight, so keep the pool small
+        self.config = config or ClientConfig(
+            network=NetworkConfig(http_pool_limit=8, http_pool_limit_per_host=8)
+        )
         self.network_manager = NetworkManager(
             base_url=base_url, session_id=self.session_id, config=self.config
         )
@@ -330,15 +679,15 @@ class TradingDashboard:
                 price = float(data["last_price"])
 
                 # Log every WS message for debugging
-                if self._latest_processed_timestamp:
-                    time_gap = (timestamp - self._latest_processed_timestamp).total_seconds()
-                    if self._latest_processed_timestamp and hasattr(self, '_last_ws_price'):
-                        price_gap = abs(price - self._last_ws_price)
-                        if price_gap > 1.0:
-                            self.logger.warning(
-                                "WS PRICE JUMP: %.2f -> %.2f (gap=%.2f) after %.3fs",
-                                self._last_ws_price, price, price_gap, time_gap
-                            )
+                if self._latest_processed_timestamp and hasattr(self, '_last_ws_price'):
+                    price_gap = abs(price - self._last_ws_price)
+                    if price_gap > 1.0:
+                        # Only build the timedelta when there is something to report
+                        time_gap = (timestamp - self._latest_processed_timestamp).total_seconds()
+                        self.logger.warning(
+                            "WS PRICE JUMP: %.2f -> %.2f (gap=%.2f) after %.3fs",
+                            self._last_ws_price, price, price_gap, time_gap
+                        )
                 self._last_ws_price = price
 
                 # Skip if we've already processed this exact timestamp from any source
@@ -372,6 +721,7 @@ class TradingDashboard:
                     float(data["ask"]),
                     float(data["volume_24h"]),
                     data["symbol"],
+                    timestamp_ns=data.get("ts_ns"),
                 )
 
                 # Add tick to candlestick aggregator
@@ -379,10 +729,25 @@ class TradingDashboard:
 
                 # Update latest processed timestamp
                 self._latest_processed_timestamp = timestamp
-        except Exception as e:
-            print(f"Error processing WebSocket message: {e}")
-            import traceback
-            traceback.print_exc()
+                self._record_ws_tick(price)
+        except Exception:
+            self.logger.exception("Error processing WebSocket message")
+
+    def _record_ws_tick(self, price: float) -> None:
+        """Accumulate tick stats and log a summary every LOG_EVERY ticks."""
+        self._ws_tick_count += 1
+        if price < self._ws_price_min:
+            self._ws_price_min = price
+        if price > self._ws_price_max:
+            self._ws_price_max = price
+        if self._ws_tick_count % LOG_EVERY == 0:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "WS ticks=%d min=%.2f max=%.2f last=%.2f",
+                    self._ws_tick_count, self._ws_price_min, self._ws_price_max, price
+                )
+            self._ws_price_min = float("inf")
+            self._ws_price_max = float("-inf")
 
     def _handle_connection_change(self, connected: bool) -> None:
         """Handle connection state changes from network manager.
@@ -410,13 +775,8 @@ class TradingDashboard:
             market_data = data.get("data")
             if symbol and market_data:
                 # Update market data buffer with reconciled data
-                ts_str = market_data.get("timestamp", "")
-                if ts_str:
-                    if "Z" in ts_str:
-                        ts_str = ts_str.replace("Z", "+00:00")
-                    elif "+" not in ts_str and ts_str.count("-") <= 2:
-                        ts_str = ts_str + "+00:00"
-                    timestamp = datetime.fromisoformat(ts_str)
+                timestamp = self._parse_timestamp(market_data.get("timestamp", ""))
+                if timestamp:
                     price = float(market_data.get("last_price", 0))
                     self.market_data.add(
                         timestamp,
@@ -435,34 +795,44 @@ class TradingDashboard:
                     len(prices),
                     symbol,
                 )
+                latest = self._latest_processed_timestamp
+                rows = []
+                invalid = out_of_order = 0
                 for point in prices:
                     timestamp = self._parse_timestamp(point.get("timestamp"))
                     if not timestamp:
-                        self.logger.warning("Skipping price history entry with invalid timestamp")
+                        invalid += 1
                         continue
 
                     # Skip if we've already processed this timestamp
-                    if self._latest_processed_timestamp is not None and timestamp < self._latest_processed_timestamp:
-                        self.logger.warning(
-                            "Skipping REST tick at %s (already processed up to %s) - OUT OF ORDER",
-                            timestamp, self._latest_processed_timestamp
-                        )
+                    if latest is not None and timestamp < latest:
+                        out_of_order += 1
                         continue
-                    elif self._latest_processed_timestamp is not None and timestamp == self._latest_processed_timestamp:
-                        self.logger.debug(
-                            "REST tick has same timestamp %s as previous - allowing through",
-                            timestamp
-                        )
 
-                    price = float(point.get("price", 0))
-                    bid = float(point.get("bid", 0))
-                    ask = float(point.get("ask", 0))
-                    volume = float(point.get("volume_24h", 0))
-                    self.market_data.add(timestamp, price, bid, ask, volume, symbol)
-                    self.candlestick_aggregator.add_tick(timestamp, price, 0.01, source="REST")
+                    rows.append((
+                        timestamp,
+                        float(point.get("price", 0)),
+                        float(point.get("bid", 0)),
+                        float(point.get("ask", 0)),
+                        float(point.get("volume_24h", 0)),
+                        symbol,
+                    ))
+                    latest = timestamp
+
+                if invalid:
+                    self.logger.warning("Skipped %d price history entries with invalid timestamps", invalid)
+                if out_of_order:
+                    self.logger.warning(
+                        "Skipped %d REST ticks already processed up to %s - OUT OF ORDER",
+                        out_of_order, self._latest_processed_timestamp
+                    )
 
-                    # Update latest processed timestamp
-                    self._latest_processed_timestamp = timestamp
+                # One lock acquisition and one ring write for the whole batch
+                self.candlestick_aggregator.add_ticks(
+                    ((row[0], row[1], 0.01) for row in rows), source="REST"
+                )
+                self.market_data.add_many(rows)
+                self._latest_processed_timestamp = latest
         elif recon_type == "orders":
             # Orders were reconciled
             self.account.update_orders(data)
@@ -477,16 +847,13 @@ class TradingDashboard:
                     # WebSocket connected - stop REST polling if active
                     await self._stop_rest_polling()
 
-                    subscribe_msg = {
-                        "type": "SUBSCRIBE",
-                        "channel": "TICKER",
-                        "symbol": self.symbol,
-                        "request_id": "dashboard_sub",
-                    }
-                    await self.network_manager.send_ws_message(subscribe_msg)
+                    msg, frame = subscribe_message("TICKER", self.symbol)
+                    await self.network_manager.send_ws_message(msg, frame)
 
+                    # No per-receive timeout: the heartbeat and idle monitor close a
+                    # silent socket, which wakes this receive, and shutdown cancels it
                     while self.running:
-                        msg = await self.network_manager.receive_ws_message(timeout=1.0)
+                        msg = await self.network_manager.receive_ws_message()
                         if msg is None:
                             # Check connection health
                             health = self.network_manager.get_connection_health()
@@ -528,17 +895,7 @@ class TradingDashboard:
 
     def _parse_timestamp(self, value: str) -> Optional[datetime]:
         """Parse ISO timestamp strings."""
-        if not value:
-            return None
-        ts_str = value
-        if "Z" in ts_str:
-            ts_str = ts_str.replace("Z", "+00:00")
-        elif "+" not in ts_str and ts_str.count("-") <= 2:
-            ts_str = ts_str + "+00:00"
-        try:
-            return datetime.fromisoformat(ts_str)
-        except ValueError:
-            return None
+        return parse_timestamp(value)
 
     async def poll_rest_market_data(self, immediate_first_poll: bool = False):
         """Periodically fetch market data via REST while WebSocket is offline.
@@ -563,15 +920,16 @@ class TradingDashboard:
                 self.logger.info("Polling REST for market data from %s to %s", start_time, end_time)
 
                 # Request price history for the subscribed symbol
-                endpoint = f"/api/v1/prices?symbol={self.symbol}"
+                params = {"symbol": self.symbol, "end": end_time.isoformat()}
                 if start_time:
-                    endpoint += f"&start={start_time.isoformat()}"
-                endpoint += f"&end={end_time.isoformat()}"
+                    params["start"] = start_time.isoformat()
 
-                resp = await self.network_manager.rest_request("GET", endpoint)
+                resp = await self.network_manager.rest_request(
+                    "GET", "/api/v1/prices", params=params
+                )
 
                 if resp and resp.status == 200:
-                    data = await resp.json()
+                    data = loads(await resp.read())
                     prices = data.get("prices", [])
 
                     if prices:
@@ -596,44 +954,143 @@ class TradingDashboard:
         """Periodically fetch account state via REST."""
         while self.running:
             try:
-                # Health check
-                health_resp = await self.network_manager.rest_request("GET", "/health")
-                self.health.rest_check(health_resp is not None and health_resp.status == 200)
-
-                # Balance
-                balance_resp = await self.network_manager.rest_request(
-                    "GET", "/api/v1/balance"
-                )
-                if balance_resp and balance_resp.status == 200:
-                    data = await balance_resp.json()
-                    self.account.update_balances(data.get("balances", {}))
-
-                # Orders
-                orders_resp = await self.network_manager.rest_request(
-                    "GET", "/api/v1/orders"
-                )
-                if orders_resp and orders_resp.status == 200:
-                    data = await orders_resp.json()
-                    self.account.update_orders(data.get("orders", []))
+                if self._batch_account_endpoint:
+                    await self._poll_account_batch()
+                else:
+                    await self._poll_account_separately()
 
             except Exception as e:
                 self.health.rest_check(False)
-                print(f"REST error: {e}")
+                self.logger.error("REST error: %s", e)
 
             await asyncio.sleep(2)
 
-    def run_async_loop(self):
-        """Run async event loop in thread."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    async def _poll_account_batch(self):
+        """Fetch health, balances and orders in a single round trip."""
+        endpoint = "/api/v1/dashboard"
+        resp = await self.network_manager.rest_request(
+            "GET", endpoint, headers=self._conditional_headers(endpoint)
+        )
 
-        async def main():
+        if resp is not None and resp.status == 404:
+            resp.release()
+            self.logger.info("Server has no /api/v1/dashboard; polling endpoints separately")
+            self._batch_account_endpoint = False
+            await self._poll_account_separately()
+            return
+
+        # 304 means the account state is unchanged since the last poll
+        self.health.rest_check(resp is not None and resp.status in (200, 304))
+
+        if resp and resp.status == 200:
+            self._remember_etag(endpoint, resp)
+            data = loads(await resp.read())
+            self.account.update(balances=data.get("balances"), orders=data.get("orders"))
+        elif resp is not None:
+            resp.release()
+
+    async def _poll_account_separately(self):
+        """Fetch health, balances and orders with concurrent requests."""
+        health, balance, orders = await asyncio.gather(
+            self._get_json("/health"),
+            self._get_json("/api/v1/balance"),
+            self._get_json("/api/v1/orders"),
+            return_exceptions=True,
+        )
+
+        self.health.rest_check(isinstance(health, dict))
+        if isinstance(balance, dict) or isinstance(orders, dict):
+            self.account.update(
+                balances=balance.get("balances", {}) if isinstance(balance, dict) else None,
+                orders=orders.get("orders", []) if isinstance(orders, dict) else None,
+            )
+
+    async def _get_json(self, endpoint: str) -> Optional[dict]:
+        """GET endpoint; None if it failed or is unchanged since the last poll."""
+        resp = await self.network_manager.rest_request(
+            "GET", endpoint, headers=self._conditional_headers(endpoint)
+        )
+        if resp is None:
+            return None
+        if resp.status != 200:
+            resp.release()
+            return None
+        self._remember_etag(endpoint, resp)
+        return loads(await resp.read())
+
+    def _conditional_headers(self, endpoint: str) -> Optional[dict]:
+        etag = self._etags.get(endpoint)
+        return {"If-None-Match": etag} if etag else None
+
+    def _remember_etag(self, endpoint: str, resp: aiohttp.ClientResponse) -> None:
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etags[endpoint] = etag
+
+    async def run_network(self):
+        """Run the WebSocket and REST tasks, closing connections on exit."""
+        try:
             await asyncio.gather(
                 self.start_websocket(),
                 self.update_account_state(),
             )
+        finally:
+            self.running = False
+            try:
+                if self._rest_polling_active:
+                    await self._stop_rest_polling()
+                await self.network_manager.close()
+            except Exception as e:
+                self.logger.error("Error closing network manager: %s", e)
+
+    def _get_snapshot(self, max_points: int = 1000, method: str = "lttb") -> dict:
+        """Get the market data snapshot for the current buffer version.
+
+        Args:
+            max_points: Maximum number of points to return
+            method: Downsampling method passed to MarketDataBuffer.get
+
+        Returns:
+            Buffer snapshot, shared read-only between callbacks until new ticks arrive
+        """
+        with self._snapshot_lock:
+            version = self.market_data.version
+            cached = self._snapshots.get((max_points, method))
+            if cached is None or cached[0] != version:
+                cached = (version, self.market_data.get(max_points=max_points, method=method))
+                self._snapshots[(max_points, method)] = cached
+            return cached[1]
+
+    def _get_candle_columns(self, max_candles: int = 120) -> dict:
+        """Get the candle columns for the current set of completed candles.
+
+        Args:
+            max_candles: Maximum number of candles to return
 
-        loop.run_until_complete(main())
+        Returns:
+            Candle columns, shared read-only between callbacks until a candle completes
+        """
+        with self._snapshot_lock:
+            key = (self.candlestick_aggregator.candle_version, max_candles)
+            if self._candle_snapshot is None or self._candle_snapshot_key != key:
+                self._candle_snapshot = self.candlestick_aggregator.get_candle_columns(max_candles)
+                self._candle_snapshot_key = key
+            return self._candle_snapshot
+
+    def _candle_xaxis_range(self) -> Optional[list]:
+        """Get the shared chart x-axis range in local time.
+
+        Returns:
+            [start, end] spanning 120 candles from the oldest shown candle, or
+            None if no candle has completed yet
+        """
+        candle_timestamps = self._get_candle_columns()["timestamps"]
+        if len(candle_timestamps) == 0:
+            return None
+        xaxis_start = (candle_timestamps[0] + _local_offset()).astype("datetime64[us]").item()
+        # End at first timestamp + time span (with small padding for better visualization)
+        xaxis_end = xaxis_start + timedelta(seconds=(120 + 1) * self.current_interval)
+        return [xaxis_start, xaxis_end]
 
     def create_app(self):
         """Create Dash application."""
@@ -678,15 +1135,76 @@ class TradingDashboard:
                 ], style={"width": "28%", "display": "inline-block", "vertical-align": "top", "padding": "10px"}),
             ]),
 
-            dcc.Interval(id="update-interval", interval=1000, n_intervals=0),
+            dcc.Interval(id="update-interval", interval=1000, n_intervals=0, disabled=False),
+            dcc.Interval(id="visibility-check", interval=500, n_intervals=0),
+            *(dcc.Store(id=f"{output}-rendered") for output in _RENDERED_OUTPUTS),
         ], style={"fontFamily": "Arial, sans-serif", "backgroundColor": "#f5f5f5"})
 
+        # Runs in the browser: pause the server-side refresh while the tab is hidden
+        app.clientside_callback(
+            """
+            function(n, disabled) {
+                const hidden = document.visibilityState === "hidden";
+                return hidden === disabled ? window.dash_clientside.no_update : hidden;
+            }
+            """,
+            Output("update-interval", "disabled"),
+            Input("visibility-check", "n_intervals"),
+            State("update-interval", "disabled"),
+        )
+
+        # Layouts are built once: go.Layout validates and resolves the template on
+        # every construction, which costs milliseconds per figure. Callbacks copy
+        # these dicts and fill in only the title and x-axis range.
+        empty_price_layout = go.Layout(
+            title="Price Movement", template="plotly_white"
+        ).to_plotly_json()
+        empty_spread_layout = go.Layout(
+            title="Bid-Ask Spread", template="plotly_white"
+        ).to_plotly_json()
+        price_layout = go.Layout(
+            xaxis={
+                "title": "Time",
+                "fixedrange": True,  # Prevent zoom/pan on x-axis
+            },
+            yaxis={
+                "title": "Price (USD)",
+                # y-axis remains dynamic (auto-scaling)
+            },
+            template="plotly_white",
+            hovermode="x unified",
+            height=350,
+            margin={"l": 50, "r": 20, "t": 40, "b": 40},
+        ).to_plotly_json()
+        spread_layout = go.Layout(
+            title="Bid-Ask Spread",
+            xaxis={
+                "title": "Time",
+                "fixedrange": True,  # Prevent zoom/pan on x-axis, keep in sync with price chart
+            },
+            yaxis={"title": "Spread (USD)"},
+            template="plotly_white",
+            height=250,
+            margin={"l": 50, "r": 20, "t": 40, "b": 40},
+        ).to_plotly_json()
+
         @app.callback(
             Output("connection-status", "children"),
+            Output("connection-status-rendered", "data"),
             Input("update-interval", "n_intervals"),
+            State("connection-status-rendered", "data"),
         )
-        def update_connection_status(n):
+        def update_connection_status(n, rendered):
             health = self.health.get()
+            key = _render_key(
+                n,
+                rendered,
+                health["ws_connected"],
+                health["rest_healthy"],
+                health["ws_message_count"],
+            )
+            if key is None:
+                return no_update, no_update
 
             ws_status = "🟢 Connected" if health["ws_connected"] else "🔴 Disconnected"
             rest_status = "🟢 Healthy" if health["rest_healthy"] else "🔴 Unhealthy"
@@ -695,17 +1213,23 @@ class TradingDashboard:
                 html.Span(f"WebSocket: {ws_status}", style={"marginRight": "20px"}),
                 html.Span(f"REST: {rest_status}", style={"marginRight": "20px"}),
                 html.Span(f"Messages: {health['ws_message_count']}"),
-            ])
+            ]), key
 
         @app.callback(
             Output("market-info", "children"),
+            Output("market-info-rendered", "data"),
             Input("update-interval", "n_intervals"),
+            State("market-info-rendered", "data"),
         )
-        def update_market_info(n):
-            data = self.market_data.get()
+        def update_market_info(n, rendered):
+            key = _render_key(n, rendered, self.market_data.version)
+            if key is None:
+                return no_update, no_update
+
+            data = self._get_snapshot()
 
-            if not data["prices"]:
-                return "Waiting for data..."
+            if len(data["prices"]) == 0:
+                return "Waiting for data...", key
 
             current_price = data["prices"][-1]
             symbol = data["symbol"] or "Unknown"
@@ -725,62 +1249,52 @@ class TradingDashboard:
                     html.Span(f"${current_price:,.2f} ", style={"fontSize": "24px", "fontWeight": "bold", "color": "#2980b9"}),
                     html.Span(change_text, style={"color": change_color, "fontSize": "16px"}),
                 ]),
-            ])
+            ]), key
 
         @app.callback(
             Output("price-chart", "figure"),
+            Output("price-chart-rendered", "data"),
             [Input("update-interval", "n_intervals"),
              Input("candle-interval-selector", "value")],
+            State("price-chart-rendered", "data"),
         )
-        def update_price_chart(n, interval_value):
+        def update_price_chart(n, interval_value, rendered):
             # Handle interval changes
             if interval_value and interval_value != self.current_interval:
                 self.candlestick_aggregator.set_interval(interval_value)
                 self.current_interval = interval_value
 
+            # Only completed candles are drawn, so ticks inside the open candle change nothing
+            key = _render_key(
+                n,
+                rendered,
+                self.candlestick_aggregator.candle_version,
+                self.market_data.symbol,
+                self.current_interval,
+            )
+            if key is None:
+                return no_update, no_update
+
             # Get exactly 120 most recent candles (or all if less than 120)
-            candles = self.candlestick_aggregator.get_candles(max_candles=120)
-            data = self.market_data.get()
-
-            if not candles:
-                return {"data": [], "layout": go.Layout(title="Price Movement", template="plotly_white")}
-
-            # Extract OHLCV data from candles and convert timestamps to local timezone
-            timestamps = []
-            for c in candles:
-                ts = c["timestamp"]
-                # Convert UTC to local timezone if timezone-aware
-                if ts.tzinfo is not None:
-                    ts = ts.astimezone()
-                timestamps.append(ts)
-            
-            opens = [c["open"] for c in candles]
-            highs = [c["high"] for c in candles]
-            lows = [c["low"] for c in candles]
-            closes = [c["close"] for c in candles]
-
-            # Calculate x-axis range to show exactly 120 candles worth of time
-            # Use the current interval to determine the time span
-            if len(candles) > 0:
-                # Calculate the time span for 120 candles
-                time_span_seconds = 120 * self.current_interval
-                # Start from the first candle's timestamp (already converted to local)
-                xaxis_start = timestamps[0]
-                # End at first timestamp + time span (with small padding for better visualization)
-                xaxis_end = xaxis_start + timedelta(seconds=time_span_seconds + self.current_interval)
-                
-                xaxis_range = [xaxis_start, xaxis_end]
-            else:
-                xaxis_range = None
+            candles = self._get_candle_columns()
+            data = self._get_snapshot()
+
+            if len(candles["close"]) == 0:
+                return {"data": [], "layout": empty_price_layout}, key
+
+            # Candle timestamps are naive UTC; shift them into the local timezone
+            timestamps = candles["timestamps"] + _local_offset()
+
+            xaxis_range = self._candle_xaxis_range()
 
             return {
                 "data": [
                     go.Candlestick(
                         x=timestamps,
-                        open=opens,
-                        high=highs,
-                        low=lows,
-                        close=closes,
+                        open=candles["open"],
+                        high=candles["high"],
+                        low=candles["low"],
+                        close=candles["close"],
                         name="Price",
                         increasing_line_color="#27ae60",
                         decreasing_line_color="#e74c3c",
@@ -788,65 +1302,50 @@ class TradingDashboard:
                         decreasing_fillcolor="#e74c3c",
                     ),
                 ],
-                "layout": go.Layout(
-                    title=f"{data.get('symbol', 'Unknown')} Price - Candlestick Chart",
-                    xaxis={
-                        "title": "Time",
-                        "range": xaxis_range,
-                        "fixedrange": True,  # Prevent zoom/pan on x-axis
-                    },
-                    yaxis={
-                        "title": "Price (USD)",
-                        # y-axis remains dynamic (auto-scaling)
-                    },
-                    template="plotly_white",
-                    hovermode="x unified",
-                    height=350,
-                    margin={"l": 50, "r": 20, "t": 40, "b": 40},
-                ),
-            }
+                "layout": {
+                    **price_layout,
+                    "title": {"text": f"{data.get('symbol', 'Unknown')} Price - Candlestick Chart"},
+                    "xaxis": {**price_layout["xaxis"], "range": xaxis_range},
+                },
+            }, key
 
         @app.callback(
             Output("spread-chart", "figure"),
+            Output("spread-chart-rendered", "data"),
             [Input("update-interval", "n_intervals"),
              Input("candle-interval-selector", "value")],
+            State("spread-chart-rendered", "data"),
         )
-        def update_spread_chart(n, interval_value):
-            data = self.market_data.get(max_points=1000)
-
-            if not data["prices"]:
-                return {"data": [], "layout": go.Layout(title="Bid-Ask Spread", template="plotly_white")}
-
-            spreads = [ask - bid for bid, ask in zip(data["bids"], data["asks"])]
-
-            # Convert timestamps to local timezone
-            local_timestamps = []
-            for ts in data["timestamps"]:
-                if ts.tzinfo is not None:
-                    ts = ts.astimezone()
-                local_timestamps.append(ts)
-
-            # Calculate the same x-axis range as the price chart (120 candles worth of time)
-            # Get the candles to determine the exact time window used in the price chart
-            candles = self.candlestick_aggregator.get_candles(max_candles=120)
-            if len(candles) > 0:
-                # Use the same calculation as the price chart
-                time_span_seconds = 120 * self.current_interval
-                xaxis_start_ts = candles[0]["timestamp"]
-                # Convert to local timezone
-                if xaxis_start_ts.tzinfo is not None:
-                    xaxis_start_ts = xaxis_start_ts.astimezone()
-                xaxis_start = xaxis_start_ts
-                xaxis_end = xaxis_start + timedelta(seconds=time_span_seconds + self.current_interval)
-                xaxis_range = [xaxis_start, xaxis_end]
-            elif len(local_timestamps) > 0:
+        def update_spread_chart(n, interval_value, rendered):
+            key = _render_key(
+                n,
+                rendered,
+                self.market_data.version,
+                self.candlestick_aggregator.candle_version,
+                interval_value,
+            )
+            if key is None:
+                return no_update, no_update
+
+            # Bucket means rather than LTTB picks, which follow the price shape and alias the spread
+            data = self._get_snapshot(method="mean")
+
+            if len(data["prices"]) == 0:
+                return {"data": [], "layout": empty_spread_layout}, key
+
+            spreads = data["asks"] - data["bids"]
+
+            # Buffer timestamps are naive UTC; shift them into the local timezone
+            local_timestamps = data["timestamps"] + _local_offset()
+
+            # Use the same x-axis range as the price chart (120 candles worth of time)
+            xaxis_range = self._candle_xaxis_range()
+            if xaxis_range is None:
                 # Fallback: calculate from tick data if no candles yet
                 time_span_seconds = 120 * self.current_interval
-                xaxis_end = local_timestamps[-1]
+                xaxis_end = local_timestamps[-1].astype("datetime64[us]").item()
                 xaxis_start = xaxis_end - timedelta(seconds=time_span_seconds)
                 xaxis_range = [xaxis_start, xaxis_end]
-            else:
-                xaxis_range = None
 
             return {
                 "data": [
@@ -858,29 +1357,26 @@ class TradingDashboard:
                         line={"color": "#9b59b6", "width": 2},
                     ),
                 ],
-                "layout": go.Layout(
-                    title="Bid-Ask Spread",
-                    xaxis={
-                        "title": "Time",
-                        "range": xaxis_range,
-                        "fixedrange": True,  # Prevent zoom/pan on x-axis, keep in sync with price chart
-                    },
-                    yaxis={"title": "Spread (USD)"},
-                    template="plotly_white",
-                    height=250,
-                    margin={"l": 50, "r": 20, "t": 40, "b": 40},
-                ),
-            }
+                "layout": {
+                    **spread_layout,
+                    "xaxis": {**spread_layout["xaxis"], "range": xaxis_range},
+                },
+            }, key
 
         @app.callback(
             Output("account-info", "children"),
+            Output("account-info-rendered", "data"),
             Input("update-interval", "n_intervals"),
+            State("account-info-rendered", "data"),
         )
-        def update_account_info(n):
+        def update_account_info(n, rendered):
             state = self.account.get()
+            key = _render_key(n, rendered, state["balances_version"])
+            if key is None:
+                return no_update, no_update
 
             if not state["balances"]:
-                return "Loading..."
+                return "Loading...", key
 
             balance_items = [
                 html.Div([
@@ -895,14 +1391,19 @@ class TradingDashboard:
                 "padding": "15px",
                 "borderRadius": "5px",
                 "marginTop": "10px",
-            })
+            }), key
 
         @app.callback(
             Output("orders-info", "children"),
+            Output("orders-info-rendered", "data"),
             Input("update-interval", "n_intervals"),
+            State("orders-info-rendered", "data"),
         )
-        def update_orders_info(n):
+        def update_orders_info(n, rendered):
             state = self.account.get()
+            key = _render_key(n, rendered, state["orders_version"])
+            if key is None:
+                return no_update, no_update
 
             if not state["orders"]:
                 return html.Div("No open orders", style={
@@ -910,7 +1411,7 @@ class TradingDashboard:
                     "padding": "15px",
                     "borderRadius": "5px",
                     "marginTop": "10px",
-                })
+                }), key
 
             order_items = []
             for order in state["orders"][:10]:
@@ -932,35 +1433,31 @@ class TradingDashboard:
                 "marginTop": "10px",
                 "maxHeight": "400px",
                 "overflowY": "auto",
-            })
+            }), key
 
         return app
 
     def run(self):
-        """Start dashboard."""
-        self.running = True
+        """Start dashboard.
 
-        thread = Thread(target=self.run_async_loop, daemon=True)
-        thread.start()
+        The Dash server runs in a daemon thread while the network tasks own the
+        main thread's event loop, so shutdown closes connections on the same
+        loop that opened them.
+        """
+        self.running = True
 
         app = self.create_app()
+        thread = Thread(
+            target=app.run,
+            kwargs={"debug": False, "host": "127.0.0.1", "port": 8050},
+            daemon=True,
+        )
+        thread.start()
 
         print("\nDashboard running at http://127.0.0.1:8050")
         print("Press Ctrl+C to stop\n")
 
         try:
-            app.run(debug=False, host="127.0.0.1", port=8050)
+            asyncio.run(self.run_network())
         except KeyboardInterrupt:
             print("\nStopping dashboard...")
-            self.running = False
-            # Close network manager connections and stop REST polling
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                # Stop REST polling if active
-                if self._rest_polling_active:
-                    loop.run_until_complete(self._stop_rest_polling())
-                loop.run_until_complete(self.network_manager.close())
-                loop.close()
-            except Exception as e:
-                print(f"Error closing network manager: {e}")
@@ -0,0 +1,35 @@
+"""JSON encoding for client WebSocket and REST payloads.
+
+Uses orjson when it is installed and falls back to the standard library.
+Both ``loads`` implementations accept ``str`` or ``bytes``; ``dumpb`` returns
+UTF-8 bytes suitable for binary WebSocket frames.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    dumpb = orjson.dumps
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        return json.dumps(obj).encode()
@@ -1,11 +1,12 @@
 """WebSocket heartbeat management."""
 
 import asyncio
-import json
 import uuid
-from datetime import datetime
 from typing import Optional, Dict, Callable
 
+# PING frames differ only in the UUID, so format it into a pre-encoded body
+_PING_TEMPLATE = b'{"type":"PING","request_id":"%b"}'
+
 
 class HeartbeatManager:
     """Manages WebSocket heartbeat (PING/PONG) for connection health monitoring."""
@@ -30,7 +31,8 @@ class HeartbeatManager:
         self._ws = None
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._pending_pings: Dict[str, datetime] = {}
+        # Outstanding PINGs and the timer that fires if their PONG never arrives
+        self._pending_pings: Dict[str, asyncio.TimerHandle] = {}
         self._lock = asyncio.Lock()
         self._healthy = True
 
@@ -57,21 +59,27 @@ class HeartbeatManager:
                     await self._task
                 except asyncio.CancelledError:
                     pass
+            for timer in self._pending_pings.values():
+                timer.cancel()
             self._pending_pings.clear()
 
     async def handle_pong(self, request_id: str) -> None:
         """Handle PONG response.
 
+        Runs without the lock: nothing here awaits, so it cannot interleave
+        with other coroutines, and the receive loop is never held up behind a
+        PING send that is waiting on the socket.
+
         Args:
             request_id: Request ID from PONG message
         """
-        async with self._lock:
-            if request_id in self._pending_pings:
-                del self._pending_pings[request_id]
-                if not self._healthy:
-                    self._healthy = True
-                    if self.on_health_change:
-                        self.on_health_change(True)
+        timer = self._pending_pings.pop(request_id, None)
+        if timer is not None:
+            timer.cancel()
+            if not self._healthy:
+                self._healthy = True
+                if self.on_health_change:
+                    self.on_health_change(True)
 
     def is_healthy(self) -> bool:
         """Check if heartbeat is responding.
@@ -96,19 +104,17 @@ class HeartbeatManager:
 
                     # Send PING
                     request_id = str(uuid.uuid4())
-                    ping_msg = {
-                        "type": "PING",
-                        "request_id": request_id,
-                    }
 
-                    try:
-                        await self._ws.send_str(json.dumps(ping_msg))
-                        self._pending_pings[request_id] = datetime.now()
-
-                        # Schedule timeout check
-                        asyncio.create_task(self._check_pong_timeout(request_id))
+                    # A plain timer, not a task per PING, checks for the PONG. It is
+                    # armed before sending so an immediate PONG always finds it.
+                    self._pending_pings[request_id] = asyncio.get_running_loop().call_later(
+                        self.timeout, self._on_pong_timeout, request_id
+                    )
 
+                    try:
+                        await self._ws.send_bytes(_PING_TEMPLATE % request_id.encode())
                     except Exception as e:
+                        self._pending_pings.pop(request_id).cancel()
                         # Connection error
                         if self._healthy:
                             self._healthy = False
@@ -126,16 +132,15 @@ class HeartbeatManager:
                         self.on_health_change(False)
                 await asyncio.sleep(1)
 
-    async def _check_pong_timeout(self, request_id: str) -> None:
-        """Check if PONG was received within timeout."""
-        await asyncio.sleep(self.timeout)
+    def _on_pong_timeout(self, request_id: str) -> None:
+        """Mark the connection unhealthy if the PONG was not received in time.
 
-        async with self._lock:
-            if request_id in self._pending_pings:
-                # PONG not received within timeout
-                del self._pending_pings[request_id]
-                if self._healthy:
-                    self._healthy = False
-                    if self.on_health_change:
-                        self.on_health_change(False)
+        Runs as a synchronous loop callback, so its check-and-remove cannot
+        be interleaved with other coroutines and needs no lock.
+        """
+        if self._pending_pings.pop(request_id, None) is not None:
+            if self._healthy:
+                self._healthy = False
+                if self.on_health_change:
+                    self.on_health_change(False)
 
@@ -1,15 +1,16 @@
 """Network manager orchestrating all network components."""
 
 import asyncio
-import json
+import functools
 import logging
-import uuid
+import time
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple, Union
 
 import aiohttp
 
+from .codec import dumpb, dumps, loads
 from .heartbeat import HeartbeatManager
 from .rate_limiter import RestRateLimiter
 from .sequence_tracker import SequenceTracker, Gap
@@ -25,6 +26,67 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def subscribe_message(channel: str, symbol: str) -> Tuple[Dict[str, str], bytes]:
+    """Build a SUBSCRIBE message and its encoded frame once per channel/symbol."""
+    msg = {
+        "type": "SUBSCRIBE",
+        "channel": channel,
+        "symbol": symbol,
+        "request_id": f"{channel}_{symbol}",
+    }
+    return msg, dumpb(msg)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp string, treating naive values as UTC.
+
+    Cached because reconciled price history is parsed here for the backfill
+    checkpoint and again by the dashboard when it applies the same points.
+    """
+    if not value:
+        return None
+    # Fast path: the server emits offset-aware isoformat() strings, which
+    # fromisoformat parses directly without any string rewriting
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    else:
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    ts_str = value
+    if "Z" in ts_str:
+        ts_str = ts_str.replace("Z", "+00:00")
+    elif "+" not in ts_str and ts_str.count("-") <= 2:
+        ts_str = ts_str + "+00:00"
+    try:
+        return datetime.fromisoformat(ts_str)
+    except ValueError:
+        return None
+
+
+def create_http_session(config: "ClientConfig") -> aiohttp.ClientSession:
+    """Create an HTTP session with the configured connection pool.
+
+    Args:
+        config: Client configuration
+
+    Returns:
+        New client session using orjson (when available) for JSON bodies
+    """
+    network = config.network
+    connector = aiohttp.TCPConnector(
+        limit=network.http_pool_limit,
+        limit_per_host=network.http_pool_limit_per_host,
+        keepalive_timeout=network.http_keepalive_timeout,
+        ttl_dns_cache=network.http_dns_cache_ttl,
+    )
+    return aiohttp.ClientSession(connector=connector, json_serialize=dumps)
+
+
 class NetworkManager:
     """Orchestrates all network management components."""
 
@@ -33,6 +95,7 @@ class NetworkManager:
         base_url: str,
         session_id: str,
         config: Optional[ClientConfig] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
     ):
         """Initialize network manager.
 
@@ -40,6 +103,7 @@ class NetworkManager:
             base_url: Server base URL
             session_id: Session ID for requests
             config: Client configuration
+            http_session: Shared HTTP session; when given, the caller owns and closes it
         """
         if config is None:
             from ..config import ClientConfig
@@ -50,6 +114,8 @@ class NetworkManager:
         self.ws_url = base_url.replace("http", "ws") + "/ws"
         self.session_id = session_id
         self.config = config
+        # Shared sessions may serve several session IDs, so the header is per request
+        self._headers = {"X-Session-ID": session_id}
 
         # Initialize components
         self.rate_limiter = RestRateLimiter(
@@ -69,6 +135,7 @@ class NetworkManager:
             on_price_history_reconciled=self._on_price_history_reconciled,
             on_orders_reconciled=self._on_orders_reconciled,
             on_balance_reconciled=self._on_balance_reconciled,
+            get_http_session=self._get_http_session,
         )
 
         self.heartbeat = HeartbeatManager(
@@ -79,21 +146,34 @@ class NetworkManager:
 
         # Connection state
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
-        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session: Optional[aiohttp.ClientSession] = http_session
+        self._owns_http_session = http_session is None
         self._ws_connected = False
         self._connection_healthy = True
         self._subscriptions: Dict[str, set[str]] = defaultdict(set)
+        # Union of every channel's symbols, kept current by send_ws_message
         self._subscribed_symbols: set[str] = set()
-        self._last_market_timestamps: Dict[str, datetime] = {}
+        # WS ticks store the raw ISO string; it is only parsed when a backfill needs it
+        self._last_market_timestamps: Dict[str, Union[datetime, str]] = {}
         self._connection_recovery_task: Optional[asyncio.Task] = None
+        # Decoded frames from the background reader, oldest dropped when full
+        self._rx_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._reader_task: Optional[asyncio.Task] = None
         self._activity_monitor_task: Optional[asyncio.Task] = None
-        self._last_ws_message_time: datetime = datetime.now(timezone.utc)
+        # Monotonic seconds; only ever compared against itself for idle detection
+        self._last_ws_message_time: float = time.monotonic()
 
         # Callbacks
         self._on_ws_message: Optional[Callable[[Dict[str, Any]], None]] = None
         self._on_reconciliation: Optional[Callable[[str, Any], None]] = None
         self._on_connection_change: Optional[Callable[[bool], None]] = None
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session shared by WebSocket, REST and reconciliation."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = create_http_session(self.config)
+        return self._http_session
+
     async def connect_ws(self) -> bool:
         """Connect to WebSocket and start heartbeat.
 
@@ -101,14 +181,14 @@ class NetworkManager:
             True if connection successful, False otherwise
         """
         try:
-            if self._http_session is None or self._http_session.closed:
-                self._http_session = aiohttp.ClientSession()
-
-            self._ws = await self._http_session.ws_connect(self.ws_url)
+            self._ws = await self._get_http_session().ws_connect(
+                self.ws_url, compress=self.config.network.ws_compress
+            )
             self._ws_connected = True
-            self._last_ws_message_time = datetime.now(timezone.utc)
+            self._last_ws_message_time = time.monotonic()
             await self.heartbeat.start(self._ws)
             self._start_activity_monitor()
+            self._reader_task = asyncio.create_task(self._ws_reader(self._ws))
             logger.info("WebSocket connected")
             return True
         except Exception as e:
@@ -118,6 +198,7 @@ class NetworkManager:
 
     async def disconnect_ws(self) -> None:
         """Disconnect WebSocket and stop heartbeat."""
+        await self._stop_ws_reader()
         await self._stop_activity_monitor()
         await self.heartbeat.stop()
         if self._ws and not self._ws.closed:
@@ -125,11 +206,12 @@ class NetworkManager:
         self._ws = None
         self._ws_connected = False
 
-    async def send_ws_message(self, message: dict) -> bool:
+    async def send_ws_message(self, message: dict, frame: Optional[bytes] = None) -> bool:
         """Send WebSocket message.
 
         Args:
             message: Message dictionary
+            frame: Pre-encoded JSON for message, sent as-is instead of re-serializing
 
         Returns:
             True if sent successfully, False otherwise
@@ -146,85 +228,140 @@ class NetworkManager:
             symbol = message.get("symbol")
             if channel and symbol:
                 self._subscriptions[channel].discard(symbol)
-                self._subscribed_symbols.discard(symbol)
+                if not any(symbol in symbols for symbols in self._subscriptions.values()):
+                    self._subscribed_symbols.discard(symbol)
 
-        if not self._ws or self._ws.closed:
+        return await self.send_ws_bytes(frame if frame is not None else dumpb(message))
+
+    async def send_ws_bytes(self, payload: bytes) -> bool:
+        """Send an already encoded WebSocket frame.
+
+        Unlike send_ws_message, this does no subscription bookkeeping.
+
+        Args:
+            payload: UTF-8 encoded JSON message
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        ws = self._ws
+        if not ws or ws.closed:
             logger.warning("Cannot send WS message; connection not available")
             return False
 
         try:
-            await self._ws.send_str(json.dumps(message))
+            await ws.send_bytes(payload)
             return True
         except Exception as e:
             logger.error(f"WebSocket send failed: {e}")
             return False
 
     async def receive_ws_message(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
-        """Receive WebSocket message and track sequences.
+        """Receive the next WebSocket message read by the background reader.
 
         Args:
             timeout: Timeout in seconds (None = no timeout)
 
         Returns:
-            Message dictionary or None if timeout/error
+            Message dictionary, or None on timeout or when the connection ends
         """
-        if not self._ws or self._ws.closed:
+        try:
+            return self._rx_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if self._reader_task is None or self._reader_task.done():
             return None
 
         try:
-            if timeout:
-                msg = await asyncio.wait_for(self._ws.receive(), timeout=timeout)
-            else:
-                msg = await self._ws.receive()
-
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                self._last_ws_message_time = datetime.now(timezone.utc)
-
-                # Handle PONG
-                if data.get("type") == "PONG":
-                    request_id = data.get("request_id")
-                    if request_id:
-                        await self.heartbeat.handle_pong(request_id)
-
-                # Track sequences for MARKET_DATA messages
-                if data.get("type") == "MARKET_DATA" and self.config.network.reconciliation_enabled:
-                    symbol = data.get("symbol", "")
-                    sequence_id = data.get("sequence_id")
-                    if sequence_id is not None:
-                        gap = self.sequence_tracker.update("TICKER", symbol, sequence_id)
-                        if gap:
-                            # Trigger reconciliation asynchronously
-                            asyncio.create_task(
-                                self.reconciler.reconcile_market_data(symbol, gap)
-                            )
-                    timestamp = self._parse_timestamp(data.get("timestamp"))
-                    if timestamp and symbol:
-                        self._last_market_timestamps[symbol] = timestamp
-
-                # Call message handler
-                if self._on_ws_message:
-                    self._on_ws_message(data)
-
-                return data
-
-            elif msg.type == aiohttp.WSMsgType.CLOSED:
-                self._ws_connected = False
-                logger.warning("WebSocket closed by server")
-                await self._handle_silent_connection()
-                return None
-            elif msg.type == aiohttp.WSMsgType.ERROR:
-                self._ws_connected = False
-                logger.error(f"WebSocket error: {msg}")
-                return None
-
+            if timeout is None:
+                return await self._rx_queue.get()
+            return await asyncio.wait_for(self._rx_queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
+
+    async def _ws_reader(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Read frames from ws, track sequences and queue decoded messages.
+
+        A ``None`` is queued when the reader stops so blocked consumers wake up.
+        """
+        try:
+            while True:
+                msg = await ws.receive()
+
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    # A bad frame or handler error drops that frame, not the reader
+                    try:
+                        data = loads(msg.data)
+                        await self._handle_ws_data(data)
+                    except Exception as e:
+                        logger.error(f"WebSocket message error: {e}")
+                        continue
+                    self._enqueue_ws_message(data)
+
+                elif msg.type == aiohttp.WSMsgType.CLOSED:
+                    self._ws_connected = False
+                    logger.warning("WebSocket closed by server")
+                    self._start_connection_recovery()
+                    break
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    self._ws_connected = False
+                    logger.error(f"WebSocket error: {msg}")
+                    break
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"WebSocket receive error: {e}")
-            return None
+        finally:
+            self._enqueue_ws_message(None)
+
+    async def _handle_ws_data(self, data: Dict[str, Any]) -> None:
+        """Apply heartbeat, sequence tracking and callbacks to a decoded message."""
+        self._last_ws_message_time = time.monotonic()
+        msg_type = data.get("type")
+
+        # Handle PONG
+        if msg_type == "PONG":
+            request_id = data.get("request_id")
+            if request_id:
+                await self.heartbeat.handle_pong(request_id)
+
+        # Track sequences for MARKET_DATA messages
+        if msg_type == "MARKET_DATA" and self.config.network.reconciliation_enabled:
+            symbol = data.get("symbol", "")
+            sequence_id = data.get("sequence_id")
+            if sequence_id is not None:
+                gap = self.sequence_tracker.update("TICKER", symbol, sequence_id)
+                if gap:
+                    # Trigger reconciliation asynchronously
+                    asyncio.create_task(
+                        self.reconciler.reconcile_market_data(symbol, gap)
+                    )
+            timestamp = data.get("timestamp")
+            if timestamp and symbol:
+                self._last_market_timestamps[symbol] = timestamp
 
-        return None
+        # Call message handler
+        if self._on_ws_message:
+            self._on_ws_message(data)
+
+    def _enqueue_ws_message(self, data: Optional[Dict[str, Any]]) -> None:
+        """Queue a message for receive_ws_message, dropping the oldest when full."""
+        try:
+            self._rx_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._rx_queue.get_nowait()
+            self._rx_queue.put_nowait(data)
+
+    async def _stop_ws_reader(self) -> None:
+        task = self._reader_task
+        self._reader_task = None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     async def rest_request(
         self, method: str, endpoint: str, **kwargs
@@ -239,16 +376,21 @@ class NetworkManager:
         Returns:
             Response object or None if failed
         """
-        if self._http_session is None or self._http_session.closed:
-            self._http_session = aiohttp.ClientSession()
+        session = self._get_http_session()
 
-        headers = kwargs.pop("headers", {})
-        headers["X-Session-ID"] = self.session_id
+        headers = kwargs.pop("headers", None)
+        if headers:
+            headers = {**headers, **self._headers}
+        else:
+            headers = self._headers
 
         async def make_request():
             full_url = f"{self.base_url}{endpoint}"
-            logger.info("REST %s %s", method.upper(), full_url)
-            return await self._http_session.request(
+            if "params" in kwargs:
+                logger.info("REST %s %s params=%s", method.upper(), full_url, kwargs["params"])
+            else:
+                logger.info("REST %s %s", method.upper(), full_url)
+            return await session.request(
                 method, full_url, headers=headers, **kwargs
             )
 
@@ -279,17 +421,7 @@ class NetworkManager:
         }
 
     def _parse_timestamp(self, value: Optional[str]) -> Optional[datetime]:
-        if not value:
-            return None
-        ts_str = value
-        if ts_str.endswith("Z"):
-            ts_str = ts_str.replace("Z", "+00:00")
-        elif "+" not in ts_str and ts_str.count("-") <= 2:
-            ts_str = ts_str + "+00:00"
-        try:
-            return datetime.fromisoformat(ts_str)
-        except ValueError:
-            return None
+        return parse_timestamp(value)
 
     def set_on_ws_message(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Set callback for WebSocket messages.
@@ -360,14 +492,18 @@ class NetworkManager:
             # Notify dashboard of connection loss immediately
             if self._on_connection_change:
                 self._on_connection_change(False)
-            if (
-                self._connection_recovery_task is None
-                or self._connection_recovery_task.done()
-            ):
-                logger.warning("Heartbeat unhealthy; initiating silent-connection handler")
-                self._connection_recovery_task = asyncio.create_task(
-                    self._handle_silent_connection()
-                )
+            logger.warning("Heartbeat unhealthy; initiating silent-connection handler")
+            self._start_connection_recovery()
+
+    def _start_connection_recovery(self) -> None:
+        """Run the silent-connection handler unless it is already running."""
+        if (
+            self._connection_recovery_task is None
+            or self._connection_recovery_task.done()
+        ):
+            self._connection_recovery_task = asyncio.create_task(
+                self._handle_silent_connection()
+            )
 
     async def _handle_silent_connection(self) -> None:
         """Handle silent WebSocket connections by disconnecting and backfilling."""
@@ -385,10 +521,8 @@ class NetworkManager:
         if not self.config.network.reconciliation_enabled:
             return
 
-        symbols = set(self._subscribed_symbols)
-        for symbol_set in self._subscriptions.values():
-            symbols.update(symbol_set)
-
+        # Read in place: nothing below awaits until the requests are built
+        symbols = self._subscribed_symbols
         if not symbols:
             logger.info("No subscribed symbols to backfill")
             return
@@ -398,6 +532,8 @@ class NetworkManager:
         limit = self.config.network.price_history_limit
         for symbol in symbols:
             start = self._last_market_timestamps.get(symbol)
+            if isinstance(start, str):
+                start = self._parse_timestamp(start)
             tasks.append(
                 self.reconciler.reconcile_price_history(
                     symbol, start=start, end=now, limit=limit
@@ -442,15 +578,14 @@ class NetworkManager:
         if not self._ws or self._ws.closed:
             return
 
-        for channel, symbols in list(self._subscriptions.items()):
-            for symbol in list(symbols):
-                msg = {
-                    "type": "SUBSCRIBE",
-                    "channel": channel,
-                    "symbol": symbol,
-                    "request_id": f"resub_{uuid.uuid4()}",
-                }
-                await self.send_ws_message(msg)
+        frames = [
+            subscribe_message(channel, symbol)[1]
+            for channel, symbols in list(self._subscriptions.items())
+            for symbol in list(symbols)
+        ]
+        # The server takes one message per frame, so issue the writes together
+        # rather than waiting on each send before queueing the next
+        await asyncio.gather(*(self.send_ws_bytes(frame) for frame in frames))
 
     def _start_activity_monitor(self) -> None:
         if (
@@ -478,9 +613,7 @@ class NetworkManager:
                 await asyncio.sleep(max(0.5, idle_timeout / 2))
                 if not self._ws_connected:
                     break
-                elapsed = (
-                    datetime.now(timezone.utc) - self._last_ws_message_time
-                ).total_seconds()
+                elapsed = time.monotonic() - self._last_ws_message_time
                 if elapsed > idle_timeout:
                     logger.warning(
                         "WS idle for %.2fs (> %.2fs). Treating as silent.",
@@ -496,6 +629,6 @@ class NetworkManager:
         """Close all connections."""
         await self.disconnect_ws()
         await self.reconciler.close()
-        if self._http_session and not self._http_session.closed:
+        if self._owns_http_session and self._http_session and not self._http_session.closed:
             await self._http_session.close()
 
@@ -7,6 +7,7 @@ from typing import Optional, Callable, Dict, Any, List
 
 import aiohttp
 
+from .codec import loads
 from .sequence_tracker import Gap
 from typing import TYPE_CHECKING
 
@@ -33,6 +34,7 @@ class Reconciler:
         ] = None,
         on_orders_reconciled: Optional[Callable[[List[Dict]], None]] = None,
         on_balance_reconciled: Optional[Callable[[Dict[str, str]], None]] = None,
+        get_http_session: Optional[Callable[[], aiohttp.ClientSession]] = None,
     ):
         """Initialize reconciler.
 
@@ -43,18 +45,24 @@ class Reconciler:
             on_market_data_reconciled: Callback when market data is reconciled
             on_orders_reconciled: Callback when orders are reconciled
             on_balance_reconciled: Callback when balance is reconciled
+            get_http_session: Returns a shared HTTP session to use instead of
+                creating one owned by the reconciler
         """
         self.base_url = base_url
         self.session_id = session_id
+        self._headers = {"X-Session-ID": session_id}
         self.rate_limiter = rate_limiter
         self.on_market_data_reconciled = on_market_data_reconciled
         self.on_price_history_reconciled = on_price_history_reconciled
         self.on_orders_reconciled = on_orders_reconciled
         self.on_balance_reconciled = on_balance_reconciled
+        self._shared_http_session = get_http_session
         self._http_session: Optional[aiohttp.ClientSession] = None
 
     async def _get_http_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
+        if self._shared_http_session is not None:
+            return self._shared_http_session()
         if self._http_session is None or self._http_session.closed:
             self._http_session = aiohttp.ClientSession()
         return self._http_session
@@ -68,14 +76,16 @@ class Reconciler:
         """
         try:
             session = await self._get_http_session()
-            endpoint = f"/api/v1/ticker?symbol={symbol}"
+            endpoint = "/api/v1/ticker"
+            params = {"symbol": symbol}
 
             async def make_request():
                 url = f"{self.base_url}{endpoint}"
-                logger.info("REST GET %s", url)
+                logger.info("REST GET %s params=%s", url, params)
                 return await session.get(
                     url,
-                    headers={"X-Session-ID": self.session_id},
+                    params=params,
+                    headers=self._headers,
                 )
 
             response = await self.rate_limiter.retry_request(
@@ -83,7 +93,7 @@ class Reconciler:
             )
 
             if response.status == 200:
-                data = await response.json()
+                data = loads(await response.read())
                 if self.on_market_data_reconciled:
                     self.on_market_data_reconciled(symbol, data)
         except Exception as e:
@@ -100,7 +110,7 @@ class Reconciler:
                 logger.info("REST GET %s", url)
                 return await session.get(
                     url,
-                    headers={"X-Session-ID": self.session_id},
+                    headers=self._headers,
                 )
 
             response = await self.rate_limiter.retry_request(
@@ -108,7 +118,7 @@ class Reconciler:
             )
 
             if response.status == 200:
-                data = await response.json()
+                data = loads(await response.read())
                 orders = data.get("orders", [])
                 if self.on_orders_reconciled:
                     self.on_orders_reconciled(orders)
@@ -126,7 +136,7 @@ class Reconciler:
                 logger.info("REST GET %s", url)
                 return await session.get(
                     url,
-                    headers={"X-Session-ID": self.session_id},
+                    headers=self._headers,
                 )
 
             response = await self.rate_limiter.retry_request(
@@ -134,7 +144,7 @@ class Reconciler:
             )
 
             if response.status == 200:
-                data = await response.json()
+                data = loads(await response.read())
                 balances = data.get("balances", {})
                 if self.on_balance_reconciled:
                     self.on_balance_reconciled(balances)
@@ -173,7 +183,7 @@ class Reconciler:
                 logger.info("REST GET %s params=%s", url, params)
                 return await session.get(
                     url,
-                    headers={"X-Session-ID": self.session_id},
+                    headers=self._headers,
                     params=params,
                 )
 
@@ -182,7 +192,7 @@ class Reconciler:
             )
 
             if response.status == 200:
-                data = await response.json()
+                data = loads(await response.read())
                 prices = data.get("prices", [])
                 if self.on_price_history_reconciled:
                     self.on_price_history_reconciled(symbol, prices)
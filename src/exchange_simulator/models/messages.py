@@ -3,12 +3,16 @@
 from enum import Enum
 from typing import Optional, Any, Dict, List
 from decimal import Decimal
-from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel, Field, computed_field
 
 from .orders import OrderSide, OrderType, OrderStatus, TimeInForce
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
 class MessageType(str, Enum):
     """WebSocket message type enumeration."""
 
@@ -205,6 +209,15 @@ class MarketDataMessage(Message):
     low_24h: Optional[Decimal] = Field(None, description="24h low")
     sequence_id: int = Field(..., description="Sequence ID for gap detection")
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def ts_ns(self) -> int:
+        """Timestamp as integer nanoseconds since the Unix epoch."""
+        timestamp = self.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return (timestamp - _EPOCH) // _MICROSECOND * 1000
+
 
 class OrderBookLevel(BaseModel):
     """Order book price level."""
@@ -1,5 +1,6 @@
 """REST API handlers for the exchange simulator."""
 
+import hashlib
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -14,6 +15,9 @@ from .models.orders import OrderSide, OrderType, OrderStatus, TimeInForce
 from .models.messages import PlaceOrderMessage, CancelOrderMessage
 from .failures.strategies import RateLimitStrategy, FailureContext, LatencySimulationStrategy
 
+# Bodies smaller than this cost more to deflate than they save on the wire
+_COMPRESS_MIN_BYTES = 1024
+
 logger = logging.getLogger(__name__)
 
 
@@ -353,27 +357,10 @@ class RestAPIHandler:
         status = request.query.get("status")
 
         order_status = OrderStatus(status) if status else None
-        orders = self.exchange_engine.get_orders(session_id, symbol, order_status)
+        orders = self._order_summaries(session_id, symbol, order_status)
 
         await self._apply_outbound_latency()
-        return web.json_response(
-            {
-                "orders": [
-                    {
-                        "order_id": order.order_id,
-                        "symbol": order.symbol,
-                        "side": order.side.value,
-                        "type": order.order_type.value,
-                        "status": order.status.value,
-                        "price": str(order.price) if order.price else None,
-                        "quantity": str(order.quantity),
-                        "filled_quantity": str(order.filled_quantity),
-                        "created_at": order.created_at.isoformat(),
-                    }
-                    for order in orders
-                ]
-            }
-        )
+        return self._conditional_json_response(request, {"orders": orders})
 
     async def get_balance(self, request: web.Request) -> web.Response:
         """Get account balance.
@@ -384,16 +371,72 @@ class RestAPIHandler:
         await self._apply_inbound_latency()
         session_id = request.headers.get("X-Session-ID", "rest-session")
 
-        account = self.account_manager.get_or_create_account(session_id)
+        balances = self._balances(session_id)
 
         await self._apply_outbound_latency()
-        return web.json_response(
+        return self._conditional_json_response(request, {"balances": balances})
+
+    async def get_dashboard(self, request: web.Request) -> web.Response:
+        """Get health, balances and orders for the session in one response.
+
+        GET /api/v1/dashboard
+        """
+        await self._check_rate_limit(request)
+        await self._apply_inbound_latency()
+        session_id = request.headers.get("X-Session-ID", "rest-session")
+
+        balances = self._balances(session_id)
+        orders = self._order_summaries(session_id)
+
+        await self._apply_outbound_latency()
+        return self._conditional_json_response(
+            request, {"status": "ok", "balances": balances, "orders": orders}
+        )
+
+    def _conditional_json_response(
+        self, request: web.Request, payload: Dict[str, Any]
+    ) -> web.Response:
+        """Build a JSON response tagged with an ETag of its body.
+
+        Returns 304 Not Modified without a body when the request's
+        If-None-Match already names that ETag. Larger bodies are
+        compressed when the client's Accept-Encoding allows it.
+        """
+        body = json.dumps(payload).encode()
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        if request.if_none_match and any(tag.value == etag for tag in request.if_none_match):
+            response = web.Response(status=304)
+        else:
+            response = web.Response(body=body, content_type="application/json")
+            if len(body) >= _COMPRESS_MIN_BYTES:
+                response.enable_compression()
+        response.etag = etag
+        return response
+
+    def _balances(self, session_id: str) -> Dict[str, str]:
+        account = self.account_manager.get_or_create_account(session_id)
+        return {asset: str(balance) for asset, balance in account.balances.items()}
+
+    def _order_summaries(
+        self,
+        session_id: str,
+        symbol: Optional[str] = None,
+        status: Optional[OrderStatus] = None,
+    ) -> list:
+        return [
             {
-                "balances": {
-                    asset: str(balance) for asset, balance in account.balances.items()
-                }
+                "order_id": order.order_id,
+                "symbol": order.symbol,
+                "side": order.side.value,
+                "type": order.order_type.value,
+                "status": order.status.value,
+                "price": str(order.price) if order.price else None,
+                "quantity": str(order.quantity),
+                "filled_quantity": str(order.filled_quantity),
+                "created_at": order.created_at.isoformat(),
             }
-        )
+            for order in self.exchange_engine.get_orders(session_id, symbol, status)
+        ]
 
     async def get_position(self, request: web.Request) -> web.Response:
         """Get position for a symbol.
@@ -495,5 +538,6 @@ def create_rest_routes(handler: RestAPIHandler) -> list:
         web.get("/api/v1/orders/{order_id}", handler.get_order),
         web.get("/api/v1/orders", handler.get_orders),
         web.get("/api/v1/balance", handler.get_balance),
+        web.get("/api/v1/dashboard", handler.get_dashboard),
         web.get("/api/v1/position", handler.get_position),
     ]
@@ -233,9 +233,11 @@ class ExchangeServer:
 
         try:
             async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    # Clients may send JSON as binary frames to skip a str round-trip
+                    data = msg.data if msg.type == aiohttp.WSMsgType.TEXT else msg.data.decode()
                     processed_msg = await self.failure_injector.inject_inbound(
-                        msg.data, session_id
+                        data, session_id
                     )
 
                     if processed_msg is None:
@@ -400,4 +402,10 @@ if __name__ == "__main__":
         default=None,
     )
     args = parser.parse_args()
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main(args.config))
@@ -0,0 +1,361 @@
+"""Tests for dashboard data buffers."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.client.dashboard import (
+    AccountState,
+    CandlestickAggregator,
+    ConnectionHealth,
+    MarketDataBuffer,
+)
+
+
+def _ts(seconds: int) -> datetime:
+    return datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+
+
+def _rows(count: int, symbol: str = "BTC/USD") -> list:
+    return [
+        (_ts(i), 100.0 + i, 99.0 + i, 101.0 + i, float(i), symbol)
+        for i in range(count)
+    ]
+
+
+class TestMarketDataBuffer:
+    """Test cases for MarketDataBuffer."""
+
+    @pytest.fixture
+    def buffer(self):
+        """Create a small buffer so wrap-around is easy to exercise."""
+        return MarketDataBuffer(maxlen=5)
+
+    def test_add_and_get(self, buffer: MarketDataBuffer):
+        """Test that ticks are returned in insertion order."""
+        for row in _rows(3):
+            buffer.add(*row)
+
+        data = buffer.get()
+        assert data["prices"].tolist() == [100.0, 101.0, 102.0]
+        assert data["asks"].tolist() == [101.0, 102.0, 103.0]
+        assert data["symbol"] == "BTC/USD"
+        assert data["timestamps"].dtype == np.dtype("datetime64[ns]")
+        assert data["timestamps"][0] == np.datetime64("2025-01-01T00:00:00", "ns")
+
+    def test_wrap_around_keeps_latest(self, buffer: MarketDataBuffer):
+        """Test that the oldest ticks are overwritten once the buffer is full."""
+        for row in _rows(8):
+            buffer.add(*row)
+
+        data = buffer.get()
+        assert data["prices"].tolist() == [103.0, 104.0, 105.0, 106.0, 107.0]
+        assert np.all(np.diff(data["timestamps"]) > np.timedelta64(0, "ns"))
+
+    def test_get_returns_copies(self, buffer: MarketDataBuffer):
+        """Test that later writes do not mutate a previously returned snapshot."""
+        for row in _rows(5):
+            buffer.add(*row)
+        snapshot = buffer.get()
+
+        buffer.add(_ts(10), 999.0, 999.0, 999.0, 0.0, "BTC/USD")
+
+        assert 999.0 not in snapshot["prices"]
+
+    def test_naive_timestamps_are_treated_as_utc(self, buffer: MarketDataBuffer):
+        """Test that naive and UTC-aware datetimes map to the same instant."""
+        buffer.add(datetime(2025, 1, 1), 1.0, 1.0, 1.0, 0.0, "BTC/USD")
+        buffer.add(_ts(0), 1.0, 1.0, 1.0, 0.0, "BTC/USD")
+
+        timestamps = buffer.get()["timestamps"]
+        assert timestamps[0] == timestamps[1]
+
+    def test_timestamp_ns_overrides_datetime(self, buffer: MarketDataBuffer):
+        """Test that a precomputed epoch-ns timestamp is stored as given."""
+        buffer.add(None, 1.0, 1.0, 1.0, 0.0, "BTC/USD", timestamp_ns=1735689605123456789)
+
+        timestamps = buffer.get()["timestamps"]
+        assert timestamps[0] == np.datetime64("2025-01-01T00:00:05.123456789", "ns")
+
+    def test_max_points_downsamples(self):
+        """Test that max_points limits the number of returned points."""
+        buffer = MarketDataBuffer(maxlen=100)
+        buffer.add_many(_rows(100))
+
+        data = buffer.get(max_points=10)
+        assert len(data["prices"]) == 10
+        assert data["prices"][0] == 100.0
+
+    @pytest.mark.parametrize("count", [3, 5, 8])
+    def test_add_many_matches_add(self, buffer: MarketDataBuffer, count: int):
+        """Test that batched inserts behave like repeated single inserts."""
+        rows = _rows(count, symbol="ETH/USD")
+        buffer.add_many(rows)
+
+        expected = MarketDataBuffer(maxlen=5)
+        for row in rows:
+            expected.add(*row)
+
+        got = buffer.get()
+        want = expected.get()
+        for key in ("timestamps", "prices", "bids", "asks", "volumes"):
+            assert list(got[key]) == list(want[key])
+        assert got["symbol"] == "ETH/USD"
+
+    def test_add_many_longer_than_maxlen_keeps_latest(self, buffer: MarketDataBuffer):
+        """Test that a batch longer than maxlen keeps only the newest ticks."""
+        buffer.add_many(_rows(8))
+
+        assert list(buffer.get()["prices"]) == [103.0, 104.0, 105.0, 106.0, 107.0]
+
+    def test_add_many_empty_is_noop(self, buffer: MarketDataBuffer):
+        """Test that an empty batch leaves the buffer untouched."""
+        buffer.add_many([])
+
+        data = buffer.get()
+        assert len(data["prices"]) == 0
+        assert data["symbol"] is None
+        assert data["last_update"] is None
+
+    def test_max_points_keeps_latest_tick(self):
+        """Test that downsampling always includes the most recent tick."""
+        buffer = MarketDataBuffer(maxlen=100)
+        buffer.add_many(_rows(95))
+
+        data = buffer.get(max_points=10)
+        assert data["prices"][-1] == 194.0
+
+    @pytest.mark.parametrize("method", ["uniform", "lttb"])
+    def test_downsampling_after_wrap_is_ordered(self, method: str):
+        """Test that downsampling a wrapped buffer reads ticks oldest first."""
+        buffer = MarketDataBuffer(maxlen=100)
+        buffer.add_many(_rows(250))
+
+        data = buffer.get(max_points=10, method=method)
+        assert data["prices"][0] == 250.0
+        assert data["prices"][-1] == 349.0
+        assert np.all(np.diff(data["prices"]) > 0)
+        assert np.all(data["asks"] - data["prices"] == 1.0)
+
+    def test_mean_downsampling_averages_buckets(self):
+        """Test that mean downsampling averages equal buckets across the wrap."""
+        buffer = MarketDataBuffer(maxlen=100)
+        buffer.add_many(_rows(250))
+
+        data = buffer.get(max_points=10, method="mean")
+        assert data["prices"].tolist() == [254.5 + 10 * i for i in range(10)]
+        assert np.all(data["asks"] - data["bids"] == 2.0)
+        assert data["timestamps"][0] == np.datetime64(_ts(154).replace(tzinfo=None), "ns") + np.timedelta64(500, "ms")
+
+    def test_lttb_keeps_spikes_and_endpoints(self):
+        """Test that LTTB downsampling keeps extreme ticks a stride would drop."""
+        buffer = MarketDataBuffer(maxlen=1000)
+        rows = _rows(1000)
+        rows[503] = (rows[503][0], 5000.0, *rows[503][2:])
+        buffer.add_many(rows)
+
+        data = buffer.get(max_points=50, method="lttb")
+        assert len(data["prices"]) == 50
+        assert 5000.0 in data["prices"]
+        assert data["prices"][0] == 100.0
+        assert data["prices"][-1] == 1099.0
+        assert np.all(np.diff(data["timestamps"]) > np.timedelta64(0, "ns"))
+
+    def test_version_changes_only_on_writes(self, buffer: MarketDataBuffer):
+        """Test that version advances on writes and not on reads."""
+        start = buffer.version
+        buffer.add(*_rows(1)[0])
+        after_add = buffer.version
+        buffer.get()
+
+        assert after_add != start
+        assert buffer.version == after_add
+        buffer.add_many(_rows(2))
+        assert buffer.version != after_add
+
+    def test_concurrent_reader_sees_consistent_snapshots(self):
+        """Test that reads racing a writer thread never see torn rows."""
+        buffer = MarketDataBuffer(maxlen=64)
+        done = threading.Event()
+
+        def writer():
+            for i in range(20000):
+                buffer.add(_ts(i), float(i), float(i) - 1.0, float(i) + 1.0, 0.0, "BTC/USD")
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while not done.is_set():
+            data = buffer.get()
+            assert np.all(data["asks"] - data["prices"] == 1.0)
+            assert np.all(data["prices"] - data["bids"] == 1.0)
+            assert np.all(np.diff(data["prices"]) == 1.0)
+        thread.join()
+
+
+class TestAccountState:
+    """Test cases for AccountState."""
+
+    def test_update_replaces_only_given_fields(self):
+        """Test that a partial update keeps the other field."""
+        account = AccountState()
+        account.update(balances={"USD": "1"}, orders=[{"order_id": "a"}])
+        account.update(orders=[])
+
+        state = account.get()
+        assert state["balances"] == {"USD": "1"}
+        assert state["orders"] == ()
+        assert state["last_update"] <= datetime.now()
+
+    def test_snapshots_are_immutable_and_detached(self):
+        """Test that readers get read-only views unaffected by later writes."""
+        account = AccountState()
+        balances = {"USD": "1"}
+        account.update(balances=balances)
+        snapshot = account.get()
+
+        balances["USD"] = "2"
+        account.update(balances={"USD": "3"})
+
+        assert snapshot["balances"]["USD"] == "1"
+        with pytest.raises(TypeError):
+            snapshot["balances"]["USD"] = "4"
+
+    def test_get_before_update(self):
+        """Test that an untouched account reports no update time."""
+        assert AccountState().get() == {
+            "balances": {},
+            "orders": (),
+            "last_update": None,
+            "balances_version": 0,
+            "orders_version": 0,
+        }
+
+    def test_versions_move_only_on_change(self):
+        """Test that re-polling identical data leaves the versions alone."""
+        account = AccountState()
+        account.update(balances={"USD": "1"}, orders=[{"order_id": "a"}])
+        account.update(balances={"USD": "1"}, orders=[{"order_id": "a"}])
+        assert (account.get()["balances_version"], account.get()["orders_version"]) == (1, 1)
+
+        account.update(orders=[])
+        assert (account.get()["balances_version"], account.get()["orders_version"]) == (1, 2)
+
+
+class TestConnectionHealth:
+    """Test cases for ConnectionHealth."""
+
+    def test_message_marks_connected(self):
+        """Test that received frames are counted and mark the socket live."""
+        health = ConnectionHealth()
+        health.ws_message_received()
+        health.ws_message_received()
+
+        state = health.get()
+        assert state["ws_connected"]
+        assert state["ws_message_count"] == 2
+        assert state["last_ws_message"] <= datetime.now()
+
+    def test_silent_socket_is_reported_disconnected(self):
+        """Test that no frames for more than five seconds reads as disconnected."""
+        health = ConnectionHealth()
+        health.ws_message_received()
+        health._last_ws_monotonic = time.monotonic() - 6
+
+        assert not health.get()["ws_connected"]
+
+
+class TestCandlestickAggregator:
+    """Test cases for CandlestickAggregator."""
+
+    def test_ticks_within_interval_update_current_candle(self):
+        """Test that ticks inside one interval only complete on rollover."""
+        aggregator = CandlestickAggregator(interval_seconds=1)
+        start = _ts(0)
+        for offset_ms, price in [(0, 100.0), (200, 100.5), (400, 99.8), (900, 100.2)]:
+            assert aggregator.add_tick(start + timedelta(milliseconds=offset_ms), price, 0.01) == []
+
+        completed = aggregator.add_tick(_ts(1), 100.3, 0.01)
+
+        assert completed == [{
+            "timestamp": start,
+            "open": 100.0,
+            "high": 100.5,
+            "low": 99.8,
+            "close": 100.2,
+            "volume": pytest.approx(0.04),
+        }]
+        assert aggregator.get_candles() == completed
+
+    def test_interval_boundaries_are_epoch_aligned(self):
+        """Test that long intervals roll over on interval boundaries."""
+        aggregator = CandlestickAggregator(interval_seconds=900)
+        aggregator.add_tick(_ts(899), 100.0, 0.01)
+
+        assert aggregator.add_tick(_ts(899) + timedelta(milliseconds=999), 101.0, 0.01) == []
+        completed = aggregator.add_tick(_ts(900), 102.0, 0.01)
+        assert [c["timestamp"] for c in completed] == [_ts(0)]
+
+    def test_set_interval_starts_fresh(self):
+        """Test that changing the interval discards the open candle."""
+        aggregator = CandlestickAggregator(interval_seconds=900)
+        aggregator.add_tick(_ts(0), 100.0, 0.01)
+        aggregator.set_interval(1)
+
+        assert aggregator.add_tick(_ts(0) + timedelta(milliseconds=500), 101.0, 0.01) == []
+        completed = aggregator.add_tick(_ts(1), 102.0, 0.01)
+        assert completed[0]["open"] == 101.0
+
+    def test_add_ticks_matches_add_tick(self):
+        """Test that a batch builds the same candles as single ticks."""
+        ticks = [(_ts(0) + timedelta(milliseconds=300 * i), 100.0 + i % 4, 0.01) for i in range(20)]
+        single = CandlestickAggregator(interval_seconds=1)
+        expected = [c for tick in ticks for c in single.add_tick(*tick)]
+
+        batched = CandlestickAggregator(interval_seconds=1)
+
+        assert batched.add_ticks(ticks) == expected
+        assert batched.get_candles() == single.get_candles()
+
+    @pytest.mark.parametrize("completed", [3, 7])
+    def test_candle_columns_match_candles(self, completed: int):
+        """Test that the column view mirrors get_candles, including after wrap."""
+        aggregator = CandlestickAggregator(interval_seconds=1, max_candles=5)
+        for i in range(completed + 1):
+            aggregator.add_tick(_ts(i), 100.0 + i, 0.01)
+
+        candles = aggregator.get_candles(max_candles=4)
+        columns = aggregator.get_candle_columns(max_candles=4)
+
+        assert columns["timestamps"].astype("datetime64[us]").tolist() == [
+            c["timestamp"].replace(tzinfo=None) for c in candles
+        ]
+        for field in ("open", "high", "low", "close", "volume"):
+            assert columns[field].tolist() == [c[field] for c in candles]
+
+    def test_candle_columns_cleared_with_interval(self):
+        """Test that set_interval empties the column view."""
+        aggregator = CandlestickAggregator(interval_seconds=1)
+        aggregator.add_tick(_ts(0), 100.0, 0.01)
+        aggregator.add_tick(_ts(1), 101.0, 0.01)
+        aggregator.set_interval(900)
+
+        assert len(aggregator.get_candle_columns()["close"]) == 0
+
+    def test_candle_version_tracks_completed_candles(self):
+        """Test that the version moves on completion and reset, not on open-candle ticks."""
+        aggregator = CandlestickAggregator(interval_seconds=1)
+        aggregator.add_tick(_ts(0), 100.0, 0.01)
+        start = aggregator.candle_version
+        aggregator.add_tick(_ts(0) + timedelta(milliseconds=500), 101.0, 0.01)
+        assert aggregator.candle_version == start
+
+        aggregator.add_tick(_ts(1), 102.0, 0.01)
+        completed = aggregator.candle_version
+        assert completed != start
+
+        aggregator.set_interval(900)
+        assert aggregator.candle_version != completed
@@ -0,0 +1,108 @@
+"""Tests for the example client's JSON helpers."""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+EXAMPLE_CLIENT = Path(__file__).resolve().parents[2] / "examples" / "client.py"
+
+
+@pytest.fixture
+def example_client():
+    """Load examples/client.py as a module."""
+    spec = importlib.util.spec_from_file_location("example_client", EXAMPLE_CLIENT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonShim:
+    """Test cases for the loads/dumps shim."""
+
+    def test_dumps_with_orjson(self, example_client):
+        """Test that the orjson fast path produces a JSON string."""
+        pytest.importorskip("orjson")
+        msg = {"type": "SUBSCRIBE", "channel": "TICKER", "symbol": "BTC/USD"}
+
+        encoded = example_client.dumps(msg)
+
+        assert isinstance(encoded, str)
+        assert json.loads(encoded) == msg
+
+    def test_round_trip(self, example_client):
+        """Test that loads decodes what dumps produces."""
+        msg = {"type": "PLACE_ORDER", "price": "48500", "quantity": "0.25"}
+        assert example_client.loads(example_client.dumps(msg)) == msg
+        assert example_client.loads(example_client.dumps(msg).encode()) == msg
+
+    def test_order_template_is_valid_json(self, example_client):
+        """Test that the pre-encoded order body fills in to the REST schema."""
+        body = example_client.BUY_LIMIT_BTC_USD_TMPL % (b"49900", b"0.1")
+        assert json.loads(body) == {
+            "symbol": "BTC/USD",
+            "side": "BUY",
+            "type": "LIMIT",
+            "price": "49900",
+            "quantity": "0.1",
+        }
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self, loads=json.loads):
+        return self._body
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers=None):
+        self.calls += 1
+        return _FakeResponse({"n": self.calls})
+
+
+class TestTTLCache:
+    """Test cases for the stale-while-revalidate GET cache."""
+
+    async def test_fresh_hit_skips_network(self, example_client):
+        """Test that a fresh entry is served without another request."""
+        cache = example_client.TTLCache(ttl=60.0)
+        session = _FakeSession()
+
+        assert await cache.fetch(session, "/symbols") == {"n": 1}
+        assert await cache.fetch(session, "/symbols") == {"n": 1}
+        assert session.calls == 1
+
+    async def test_stale_hit_returns_old_value_and_refreshes(self, example_client):
+        """Test that a stale entry is served while a refresh runs."""
+        cache = example_client.TTLCache(ttl=0.0, swr=60.0)
+        session = _FakeSession()
+        await cache.fetch(session, "/ticker")
+
+        assert await cache.fetch(session, "/ticker") == {"n": 1}
+        await asyncio.sleep(0)
+        assert session.calls == 2
+        assert cache.data["/ticker"][0] == {"n": 2}
+
+    async def test_expired_entry_is_refetched(self, example_client):
+        """Test that entries past ttl + swr are fetched synchronously."""
+        cache = example_client.TTLCache(ttl=0.0, swr=0.0)
+        session = _FakeSession()
+        await cache.fetch(session, "/health")
+
+        assert await cache.fetch(session, "/health") == {"n": 2}
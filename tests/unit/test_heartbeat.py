@@ -16,7 +16,7 @@ class TestHeartbeatManager:
         """Create a mock WebSocket connection."""
         ws = AsyncMock()
         ws.closed = False
-        ws.send_str = AsyncMock()
+        ws.send_bytes = AsyncMock()
         return ws
 
     @pytest.fixture
@@ -31,7 +31,7 @@ class TestHeartbeatManager:
         assert heartbeat.is_healthy()
 
         await asyncio.sleep(0.15)  # Wait for at least one PING
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
         await heartbeat.stop()
         assert not heartbeat._running
@@ -42,9 +42,9 @@ class TestHeartbeatManager:
         await heartbeat.start(mock_ws)
 
         await asyncio.sleep(0.15)  # Wait for PING
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
-        call_args = mock_ws.send_str.call_args[0][0]
+        call_args = mock_ws.send_bytes.call_args[0][0]
         import json
         ping_data = json.loads(call_args)
         assert ping_data["type"] == "PING"
@@ -58,9 +58,9 @@ class TestHeartbeatManager:
         await heartbeat.start(mock_ws)
 
         await asyncio.sleep(0.15)  # Wait for PING
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
-        call_args = mock_ws.send_str.call_args[0][0]
+        call_args = mock_ws.send_bytes.call_args[0][0]
         import json
         ping_data = json.loads(call_args)
         request_id = ping_data["request_id"]
@@ -82,7 +82,7 @@ class TestHeartbeatManager:
         await heartbeat.start(mock_ws)
 
         await asyncio.sleep(0.15)  # Wait for PING
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
         await asyncio.sleep(0.1)  # Wait for timeout
         assert not heartbeat.is_healthy()
@@ -102,7 +102,7 @@ class TestHeartbeatManager:
         await heartbeat.start(mock_ws)
 
         await asyncio.sleep(0.15)  # Wait for PING
-        call_args = mock_ws.send_str.call_args[0][0]
+        call_args = mock_ws.send_bytes.call_args[0][0]
         import json
         ping_data = json.loads(call_args)
         request_id = ping_data["request_id"]
@@ -116,3 +116,42 @@ class TestHeartbeatManager:
 
         await heartbeat.stop()
 
+    @pytest.mark.asyncio
+    async def test_pong_cancels_timeout_timer(self, mock_ws):
+        """Test that a PONG cancels the pending timeout instead of leaving it armed."""
+        heartbeat = HeartbeatManager(interval=0.05, timeout=10.0)
+        await heartbeat.start(mock_ws)
+        await asyncio.sleep(0.08)
+
+        request_id, timer = next(iter(heartbeat._pending_pings.items()))
+        await heartbeat.handle_pong(request_id)
+
+        assert timer.cancelled()
+        assert request_id not in heartbeat._pending_pings
+        await heartbeat.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_timers(self, mock_ws):
+        """Test that stopping does not leave timeout callbacks behind."""
+        heartbeat = HeartbeatManager(interval=0.05, timeout=10.0)
+        await heartbeat.start(mock_ws)
+        await asyncio.sleep(0.08)
+        timers = list(heartbeat._pending_pings.values())
+
+        await heartbeat.stop()
+
+        assert timers and all(timer.cancelled() for timer in timers)
+        assert heartbeat.is_healthy()
+
+    async def test_pong_does_not_wait_for_lock(self, mock_ws):
+        """Test that a PONG is handled while the heartbeat loop holds the lock."""
+        heartbeat = HeartbeatManager(interval=10.0, timeout=10.0)
+        heartbeat._healthy = False
+        timer = asyncio.get_running_loop().call_later(10.0, lambda: None)
+        heartbeat._pending_pings["ping-1"] = timer
+
+        async with heartbeat._lock:
+            await asyncio.wait_for(heartbeat.handle_pong("ping-1"), timeout=0.1)
+
+        assert timer.cancelled()
+        assert heartbeat.is_healthy()
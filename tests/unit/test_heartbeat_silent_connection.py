@@ -17,7 +17,7 @@ class TestHeartbeatWithSilentConnection:
         """Create a mock WebSocket connection."""
         ws = AsyncMock()
         ws.closed = False
-        ws.send_str = AsyncMock()
+        ws.send_bytes = AsyncMock()
         return ws
 
     @pytest.fixture
@@ -40,7 +40,7 @@ class TestHeartbeatWithSilentConnection:
 
         # Wait for first PING
         await asyncio.sleep(0.15)
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
         # Simulate server going silent - don't respond to PING
         await asyncio.sleep(0.1)  # Wait for timeout
@@ -66,14 +66,14 @@ class TestHeartbeatWithSilentConnection:
 
         # Wait for first PING
         await asyncio.sleep(0.15)
-        assert mock_ws.send_str.called
+        assert mock_ws.send_bytes.called
 
         # Simulate timeout (no PONG)
         await asyncio.sleep(0.1)
         assert not heartbeat.is_healthy()
 
         # Get the request_id from the PING
-        call_args = mock_ws.send_str.call_args[0][0]
+        call_args = mock_ws.send_bytes.call_args[0][0]
         import json
         ping_data = json.loads(call_args)
         request_id = ping_data["request_id"]
@@ -1,8 +1,10 @@
 """Tests for message models."""
 
+import json
+
 import pytest
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.exchange_simulator.models.messages import (
     MessageType,
@@ -185,6 +187,18 @@ class TestServerMessages:
         assert msg.bid == Decimal("49999")
         assert msg.ask == Decimal("50001")
 
+    def test_market_data_message_includes_epoch_ns(self) -> None:
+        """Test that market data JSON carries the timestamp as integer nanoseconds."""
+        msg = MarketDataMessage(
+            symbol="BTC/USD",
+            last_price=Decimal("50000"),
+            sequence_id=1,
+            timestamp=datetime(2025, 1, 1, 0, 0, 5, 123456, tzinfo=timezone.utc),
+        )
+
+        data = json.loads(msg.model_dump_json())
+        assert data["ts_ns"] == 1735689605123456000
+
     def test_orderbook_update_message(self) -> None:
         """Test order book update message."""
         bids = [
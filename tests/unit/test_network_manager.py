@@ -0,0 +1,326 @@
+"""Tests for the client network manager."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pydantic
+import pytest
+
+from src.client.config import ClientConfig, NetworkConfig
+from src.client.network.network_manager import (
+    NetworkManager,
+    create_http_session,
+    parse_timestamp,
+)
+
+
+def _frame(msg_type, data):
+    return MagicMock(type=msg_type, data=data)
+
+
+def _stream(ws, *frames):
+    """Make ws.receive() return frames, then block like an idle socket."""
+    pending = list(frames)
+
+    async def receive():
+        if pending:
+            return pending.pop(0)
+        await asyncio.Event().wait()
+
+    ws.receive = receive
+
+
+class TestNetworkManager:
+    """Test cases for NetworkManager."""
+
+    @pytest.fixture
+    def mock_ws(self):
+        """Create a mock WebSocket connection."""
+        ws = AsyncMock()
+        ws.closed = False
+        ws.send_bytes = AsyncMock()
+        return ws
+
+    @pytest.fixture
+    def manager(self, mock_ws):
+        """Create a network manager attached to the mock WebSocket."""
+        manager = NetworkManager(base_url="http://localhost:8765", session_id="test")
+        manager._ws = mock_ws
+        return manager
+
+    async def test_resubscribe_sends_every_subscription(
+        self, manager: NetworkManager, mock_ws
+    ):
+        """Test that every known channel/symbol pair is re-subscribed."""
+        manager._subscriptions["TICKER"].update({"BTC/USD", "ETH/USD"})
+        manager._subscriptions["TRADES"].add("BTC/USD")
+
+        await manager._resubscribe_channels()
+
+        sent = [json.loads(call.args[0]) for call in mock_ws.send_bytes.call_args_list]
+        assert {(m["channel"], m["symbol"]) for m in sent} == {
+            ("TICKER", "BTC/USD"),
+            ("TICKER", "ETH/USD"),
+            ("TRADES", "BTC/USD"),
+        }
+        assert all(m["type"] == "SUBSCRIBE" for m in sent)
+
+    async def test_resubscribe_without_connection_is_noop(
+        self, manager: NetworkManager, mock_ws
+    ):
+        """Test that nothing is sent when the WebSocket is closed."""
+        manager._subscriptions["TICKER"].add("BTC/USD")
+        mock_ws.closed = True
+
+        await manager._resubscribe_channels()
+
+        mock_ws.send_bytes.assert_not_called()
+
+    async def test_market_data_timestamp_parsed_only_for_backfill(
+        self, manager: NetworkManager, mock_ws
+    ):
+        """Test that ticks keep the raw timestamp and backfill parses it."""
+        tick = {
+            "type": "MARKET_DATA",
+            "timestamp": "2025-01-01T00:00:05.000000Z",
+            "symbol": "BTC/USD",
+            "last_price": "50000",
+            "sequence_id": 1,
+        }
+        _stream(mock_ws, _frame(aiohttp.WSMsgType.TEXT, json.dumps(tick)))
+        manager._subscribed_symbols.add("BTC/USD")
+        manager.reconciler.reconcile_price_history = AsyncMock()
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+
+        assert await manager.receive_ws_message(timeout=1) == tick
+        assert manager._last_market_timestamps["BTC/USD"] == tick["timestamp"]
+
+        await manager._stop_ws_reader()
+        await manager._backfill_price_history()
+
+        kwargs = manager.reconciler.reconcile_price_history.call_args.kwargs
+        assert kwargs["start"] == datetime(2025, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+
+    async def test_binary_frames_are_decoded(self, manager: NetworkManager, mock_ws):
+        """Test that BINARY frames are parsed like TEXT frames."""
+        pong = {"type": "PONG", "request_id": "ping-1"}
+        _stream(mock_ws, _frame(aiohttp.WSMsgType.BINARY, json.dumps(pong).encode()))
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+
+        assert await manager.receive_ws_message(timeout=1) == pong
+        await manager._stop_ws_reader()
+
+    async def test_malformed_frame_is_skipped(self, manager: NetworkManager, mock_ws):
+        """Test that a frame that fails to decode does not stop the reader."""
+        tick = {"type": "MARKET_DATA", "symbol": "BTC/USD", "n": 1}
+        _stream(
+            mock_ws,
+            _frame(aiohttp.WSMsgType.TEXT, '{"type":"X"'),
+            _frame(aiohttp.WSMsgType.TEXT, json.dumps(tick)),
+        )
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+
+        assert await manager.receive_ws_message(timeout=1) == tick
+        assert not manager._reader_task.done()
+        await manager._stop_ws_reader()
+
+    async def test_handler_error_does_not_stop_reader(
+        self, manager: NetworkManager, mock_ws
+    ):
+        """Test that an exception from the message callback skips only that frame."""
+        msgs = [{"type": "MARKET_DATA", "symbol": "BTC/USD", "n": i} for i in range(2)]
+        manager._on_ws_message = MagicMock(side_effect=[RuntimeError("boom"), None])
+        _stream(mock_ws, *(_frame(aiohttp.WSMsgType.TEXT, json.dumps(m)) for m in msgs))
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+
+        assert await manager.receive_ws_message(timeout=1) == msgs[1]
+        await manager._stop_ws_reader()
+
+    async def test_reader_prefetches_frames_in_order(
+        self, manager: NetworkManager, mock_ws
+    ):
+        """Test that queued frames are handed out in order without waiting."""
+        msgs = [{"type": "MARKET_DATA", "symbol": "BTC/USD", "n": i} for i in range(3)]
+        _stream(mock_ws, *(_frame(aiohttp.WSMsgType.TEXT, json.dumps(m)) for m in msgs))
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+        await asyncio.sleep(0)
+
+        assert [await manager.receive_ws_message(timeout=0) for _ in msgs] == msgs
+        await manager._stop_ws_reader()
+
+    async def test_full_queue_drops_oldest(self, manager: NetworkManager):
+        """Test that a full prefetch queue discards the oldest message."""
+        manager._rx_queue = asyncio.Queue(maxsize=2)
+        for i in range(3):
+            manager._enqueue_ws_message({"n": i})
+
+        assert manager._rx_queue.get_nowait() == {"n": 1}
+        assert manager._rx_queue.get_nowait() == {"n": 2}
+
+    async def test_http_session_uses_configured_pool(self):
+        """Test that the lazily created HTTP session honours the pool settings."""
+        config = ClientConfig(
+            network=NetworkConfig(http_pool_limit=12, http_pool_limit_per_host=6)
+        )
+        session = create_http_session(config)
+        try:
+            assert session.connector.limit == 12
+            assert session.connector.limit_per_host == 6
+        finally:
+            await session.close()
+
+    async def test_injected_http_session_is_not_closed(self):
+        """Test that close() leaves a caller-owned HTTP session open."""
+        session = create_http_session(ClientConfig())
+        manager = NetworkManager(
+            base_url="http://localhost:8765", session_id="test", http_session=session
+        )
+
+        await manager.close()
+        try:
+            assert not session.closed
+        finally:
+            await session.close()
+
+    async def test_reconciler_shares_http_session(self):
+        """Test that reconciliation requests reuse the manager's HTTP session."""
+        manager = NetworkManager(base_url="http://localhost:8765", session_id="test")
+        try:
+            session = await manager.reconciler._get_http_session()
+            assert session is manager._http_session
+            assert manager.reconciler._http_session is None
+        finally:
+            await manager.close()
+        assert session.closed
+
+    async def test_send_uses_pre_encoded_frame(self, manager: NetworkManager, mock_ws):
+        """Test that a supplied frame is sent verbatim and still tracked."""
+        msg = {"type": "SUBSCRIBE", "channel": "TICKER", "symbol": "BTC/USD"}
+        frame = b'{"type":"SUBSCRIBE","channel":"TICKER","symbol":"BTC/USD"}'
+
+        assert await manager.send_ws_message(msg, frame)
+
+        mock_ws.send_bytes.assert_awaited_once_with(frame)
+        assert "BTC/USD" in manager._subscriptions["TICKER"]
+
+    async def test_unsubscribe_keeps_symbol_held_by_other_channel(
+        self, manager: NetworkManager
+    ):
+        """Test that backfill still covers a symbol left on another channel."""
+        manager.reconciler.reconcile_price_history = AsyncMock()
+        for msg_type, channel in [
+            ("SUBSCRIBE", "TICKER"),
+            ("SUBSCRIBE", "TRADES"),
+            ("UNSUBSCRIBE", "TRADES"),
+        ]:
+            await manager.send_ws_message(
+                {"type": msg_type, "channel": channel, "symbol": "BTC/USD"}
+            )
+
+        await manager._backfill_price_history()
+
+        assert manager._subscribed_symbols == {"BTC/USD"}
+        assert manager.reconciler.reconcile_price_history.call_args.args == ("BTC/USD",)
+
+        await manager.send_ws_message(
+            {"type": "UNSUBSCRIBE", "channel": "TICKER", "symbol": "BTC/USD"}
+        )
+        assert not manager._subscribed_symbols
+
+    async def test_rest_request_does_not_mutate_caller_headers(
+        self, manager: NetworkManager
+    ):
+        """Test that the session header is merged without touching caller dicts."""
+        session = MagicMock(closed=False)
+        session.request = AsyncMock(return_value=MagicMock(status=200))
+        manager._http_session = session
+        caller_headers = {"X-Trace": "1"}
+
+        await manager.rest_request("GET", "/api/v1/balance", headers=caller_headers)
+        await manager.rest_request("GET", "/api/v1/orders")
+
+        first, second = session.request.call_args_list
+        assert first.kwargs["headers"] == {"X-Trace": "1", "X-Session-ID": "test"}
+        assert second.kwargs["headers"] == {"X-Session-ID": "test"}
+        assert caller_headers == {"X-Trace": "1"}
+
+    async def test_receive_timeout_returns_none(self, manager: NetworkManager, mock_ws):
+        """Test that a receive timeout is reported as no message."""
+        _stream(mock_ws)
+        manager._reader_task = asyncio.create_task(manager._ws_reader(mock_ws))
+
+        assert await manager.receive_ws_message(timeout=0.01) is None
+        await manager._stop_ws_reader()
+
+    def test_config_is_frozen(self, manager: NetworkManager):
+        """Test that the shared configuration cannot be mutated in place."""
+        with pytest.raises(pydantic.ValidationError):
+            manager.config.network.heartbeat_interval = 1.0
+
+    def test_default_network_config_is_shared(self):
+        """Test that default configs reuse one NetworkConfig instance."""
+        assert ClientConfig().network is ClientConfig().network
+
+    async def test_receive_without_reader_returns_none(self, manager: NetworkManager):
+        """Test that receiving with no active reader does not block."""
+        assert await manager.receive_ws_message() is None
+
+    async def test_connect_requests_compression(self):
+        """Test that the WebSocket handshake offers the configured deflate window."""
+        session = MagicMock(closed=False)
+        session.ws_connect = AsyncMock(return_value=AsyncMock(closed=False))
+        manager = NetworkManager(
+            base_url="http://localhost:8765", session_id="test", http_session=session
+        )
+        manager.heartbeat.start = AsyncMock()
+        manager.heartbeat.stop = AsyncMock()
+
+        assert await manager.connect_ws()
+        await manager._stop_ws_reader()
+
+        assert session.ws_connect.call_args.kwargs["compress"] == 15
+
+    async def test_idle_monitor_flags_silent_connection(self, mock_ws):
+        """Test that no frames for longer than the idle timeout is treated as silent."""
+        manager = NetworkManager(
+            base_url="http://localhost:8765",
+            session_id="test",
+            config=ClientConfig(network=NetworkConfig(ws_idle_timeout=0.5)),
+        )
+        manager._ws = mock_ws
+        manager._ws_connected = True
+        manager._handle_silent_connection = AsyncMock()
+        manager._last_ws_message_time -= 1.0
+
+        await asyncio.wait_for(manager._monitor_ws_activity(), timeout=2)
+
+        manager._handle_silent_connection.assert_awaited_once()
+
+
+class TestParseTimestamp:
+    """Test cases for parse_timestamp."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2025-01-01T00:00:05+00:00",
+            "2025-01-01T00:00:05Z",
+            "2025-01-01T00:00:05",
+        ],
+    )
+    def test_formats_parse_to_utc(self, value):
+        """Test that offset, Z-suffixed and naive strings all map to the same UTC instant."""
+        assert parse_timestamp(value) == datetime(2025, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("value", [None, "", "not-a-timestamp"])
+    def test_missing_or_invalid_returns_none(self, value):
+        """Test that unusable values are reported as None."""
+        assert parse_timestamp(value) is None
+
+    def test_repeated_strings_hit_the_cache(self):
+        """Test that re-parsing the same string returns the cached datetime."""
+        value = "2025-01-01T00:00:07.250000+00:00"
+        assert parse_timestamp(value) is parse_timestamp(value)
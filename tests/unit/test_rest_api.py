@@ -317,6 +317,76 @@ class TestRestAPI(AioHTTPTestCase):
         assert data["balances"]["USD"] == "100000"
         assert data["balances"]["BTC"] == "10"
 
+    @unittest_run_loop
+    async def test_get_dashboard(self):
+        """Test that the dashboard endpoint combines health, balances and orders."""
+        headers = {"X-Session-ID": "test-session"}
+        await self.client.request(
+            "POST",
+            "/api/v1/orders",
+            json={
+                "symbol": "BTC/USD",
+                "side": "BUY",
+                "type": "LIMIT",
+                "price": "49000",
+                "quantity": "0.1",
+            },
+            headers=headers,
+        )
+
+        resp = await self.client.request("GET", "/api/v1/dashboard", headers=headers)
+        assert resp.status == 200
+        data = await resp.json()
+        assert data["status"] == "ok"
+        assert data["balances"]["USD"] == "100000"
+        assert len(data["orders"]) == 1
+        assert data["orders"][0]["price"] == "49000"
+
+    @unittest_run_loop
+    async def test_balance_not_modified(self):
+        """Test that a matching If-None-Match gets 304 until the body changes."""
+        headers = {"X-Session-ID": "test-session"}
+        first = await self.client.request("GET", "/api/v1/balance", headers=headers)
+        etag = first.headers["ETag"]
+
+        resp = await self.client.request(
+            "GET", "/api/v1/balance", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status == 304
+        assert await resp.read() == b""
+
+        self.account_manager.get_or_create_account("test-session").balances["USD"] = Decimal("1")
+        changed = await self.client.request(
+            "GET", "/api/v1/balance", headers={**headers, "If-None-Match": etag}
+        )
+        assert changed.status == 200
+        assert changed.headers["ETag"] != etag
+
+    @unittest_run_loop
+    async def test_large_bodies_are_compressed(self):
+        """Test that only bodies past the size threshold are gzip-encoded."""
+        headers = {"X-Session-ID": "test-session", "Accept-Encoding": "gzip"}
+        small = await self.client.request("GET", "/api/v1/balance", headers=headers)
+        assert "Content-Encoding" not in small.headers
+
+        for price in range(49000, 49010):
+            await self.client.request(
+                "POST",
+                "/api/v1/orders",
+                json={
+                    "symbol": "BTC/USD",
+                    "side": "BUY",
+                    "type": "LIMIT",
+                    "price": str(price),
+                    "quantity": "0.1",
+                },
+                headers=headers,
+            )
+
+        resp = await self.client.request("GET", "/api/v1/orders", headers=headers)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert len((await resp.json())["orders"]) == 10
+
     @unittest_run_loop
     async def test_get_position(self):
         """Test getting position for a symbol."""